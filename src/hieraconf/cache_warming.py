@@ -7,24 +7,63 @@ configuration hierarchy, eliminating first-load penalties in UI forms.
 
 import dataclasses
 import logging
-from typing import Type, Set, Optional, get_args, get_origin, Callable
-
-# Optional introspection - install openhcs for full functionality
-try:
-    from openhcs.introspection.signature_analyzer import SignatureAnalyzer
-    from openhcs.introspection.unified_parameter_analyzer import UnifiedParameterAnalyzer
-    from openhcs.ui.shared.parameter_form_service import ParameterFormService
-except ImportError:
-    SignatureAnalyzer = None
-    UnifiedParameterAnalyzer = None
-    ParameterFormService = None
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import Any, Dict, List, Type, Set, Optional, Tuple, get_args, get_origin, get_type_hints, Callable
 
 logger = logging.getLogger(__name__)
 
+# Config types whose analysis caches have already been warmed in this process
+_prewarmed_config_types: Set[Type] = set()
+
+
+@lru_cache(maxsize=None)
+def _get_analyzers() -> Tuple[Any, Any, Any]:
+    """
+    Import the optional openhcs analyzers on first use.
+
+    The imports are heavy and only needed for cache warming, so they are deferred
+    until a prewarm function is called rather than paid by every hieraconf import.
+
+    Returns:
+        (SignatureAnalyzer, UnifiedParameterAnalyzer, ParameterFormService)
+
+    Raises:
+        ImportError: If openhcs is not installed
+    """
+    try:
+        from openhcs.introspection.signature_analyzer import SignatureAnalyzer
+        from openhcs.introspection.unified_parameter_analyzer import UnifiedParameterAnalyzer
+        from openhcs.ui.shared.parameter_form_service import ParameterFormService
+    except ImportError as e:
+        raise ImportError(
+            "Cache warming requires openhcs's introspection and form services; "
+            "install openhcs for full functionality"
+        ) from e
+    return SignatureAnalyzer, UnifiedParameterAnalyzer, ParameterFormService
+
+
+@lru_cache(maxsize=None)
+def _resolved_field_types(dataclass_type: Type) -> Tuple[Any, ...]:
+    """
+    Get the annotated types of dataclass_type's fields, resolved once per class.
+
+    String annotations (from __future__ import annotations) are resolved with
+    get_type_hints; if that fails, the raw field annotations are used.
+    """
+    try:
+        type_hints = get_type_hints(dataclass_type, include_extras=True)
+    except Exception:
+        type_hints = {}
+    return tuple(
+        type_hints.get(field.name, field.type) for field in dataclasses.fields(dataclass_type)
+    )
+
 
 def _extract_all_dataclass_types(base_type: Type, visited: Optional[Set[Type]] = None) -> Set[Type]:
     """
-    Recursively extract all dataclass types from a configuration hierarchy.
+    Extract all dataclass types from a configuration hierarchy.
     
     Uses type introspection to discover all nested dataclass fields automatically.
     This is fully generic and works for any dataclass hierarchy.
@@ -38,36 +77,78 @@ def _extract_all_dataclass_types(base_type: Type, visited: Optional[Set[Type]] =
     """
     if visited is None:
         visited = set()
-    
-    # Avoid infinite recursion on circular references
-    if base_type in visited:
-        return visited
-    
-    # Only process dataclasses
-    if not dataclasses.is_dataclass(base_type):
-        return visited
-    
-    visited.add(base_type)
-    
-    # Introspect all fields to find nested dataclasses
-    for field in dataclasses.fields(base_type):
-        field_type = field.type
-        
+
+    # Breadth-first worklist; visited doubles as cycle detection
+    pending = deque([base_type])
+    while pending:
+        config_type = pending.popleft()
+
+        # Only process dataclasses not seen yet
+        if config_type in visited or not dataclasses.is_dataclass(config_type):
+            continue
+        visited.add(config_type)
+
+        # Introspect all fields to find nested dataclasses
+        pending.extend(_nested_dataclass_types(config_type))
+
+    return visited
+
+
+@lru_cache(maxsize=None)
+def _nested_dataclass_types(dataclass_type: Type) -> Tuple[Type, ...]:
+    """Get the dataclass types directly nested in dataclass_type's fields, in field order."""
+    nested = []
+    for field_type in _resolved_field_types(dataclass_type):
         # Handle Optional[T] -> extract T
-        origin = get_origin(field_type)
-        if origin is not None:
+        if get_origin(field_type) is not None:
             # For Union types (including Optional), check all args
-            args = get_args(field_type)
-            for arg in args:
-                if arg is type(None):
-                    continue
-                if dataclasses.is_dataclass(arg):
-                    _extract_all_dataclass_types(arg, visited)
-        elif dataclasses.is_dataclass(field_type):
+            for arg in get_args(field_type):
+                if isinstance(arg, type) and dataclasses.is_dataclass(arg):
+                    nested.append(arg)
+        elif isinstance(field_type, type) and dataclasses.is_dataclass(field_type):
             # Direct dataclass field
-            _extract_all_dataclass_types(field_type, visited)
-    
-    return visited
+            nested.append(field_type)
+    return tuple(nested)
+
+
+def _nested_first_levels(config_types: Set[Type]) -> List[List[Type]]:
+    """
+    Group config types into levels so nested configs come before the configs containing them.
+
+    Uses Kahn's algorithm over the nesting edges between the given types: the
+    first level holds the leaves, and each later level holds the types whose
+    children are all in earlier levels, so a parent's form analysis finds its
+    children's structures already cached. Types on a nesting cycle form a
+    final level.
+    """
+    # Count each type's nested children within the set; leaves start ready
+    parents: Dict[Type, List[Type]] = {config_type: [] for config_type in config_types}
+    remaining_children: Dict[Type, int] = {}
+    for config_type in config_types:
+        children = {child for child in _nested_dataclass_types(config_type)
+                    if child in parents and child is not config_type}
+        remaining_children[config_type] = len(children)
+        for child in children:
+            parents[child].append(config_type)
+
+    level = [config_type for config_type, count in remaining_children.items() if count == 0]
+    levels = []
+    placed = 0
+    while level:
+        levels.append(level)
+        placed += len(level)
+        next_level = []
+        for config_type in level:
+            for parent in parents[config_type]:
+                remaining_children[parent] -= 1
+                if remaining_children[parent] == 0:
+                    next_level.append(parent)
+        level = next_level
+
+    if placed < len(config_types):
+        placed_set = {config_type for level in levels for config_type in level}
+        levels.append([config_type for config_type in config_types if config_type not in placed_set])
+    return levels
 
 
 def prewarm_callable_analysis_cache(*callables: Callable) -> None:
@@ -85,6 +166,7 @@ def prewarm_callable_analysis_cache(*callables: Callable) -> None:
         >>> from hieraconf import prewarm_callable_analysis_cache
         >>> prewarm_callable_analysis_cache(AbstractStep.__init__)
     """
+    SignatureAnalyzer, UnifiedParameterAnalyzer, _ = _get_analyzers()
     for callable_obj in callables:
         SignatureAnalyzer.analyze(callable_obj)
         UnifiedParameterAnalyzer.analyze(callable_obj)
@@ -92,7 +174,38 @@ def prewarm_callable_analysis_cache(*callables: Callable) -> None:
     logger.debug(f"Pre-warmed analysis cache for {len(callables)} callables")
 
 
-def prewarm_config_analysis_cache(base_config_type: Type) -> None:
+def _prewarm_config_type(config_type: Type, service) -> None:
+    """Pre-analyze a single config type to populate the analysis caches."""
+    SignatureAnalyzer, UnifiedParameterAnalyzer, _ = _get_analyzers()
+
+    # Warm SignatureAnalyzer cache (dataclass field analysis)
+    SignatureAnalyzer._analyze_dataclass(config_type)
+
+    # Warm UnifiedParameterAnalyzer cache (parameter info with descriptions)
+    param_info = UnifiedParameterAnalyzer.analyze(config_type)
+
+    # Warm ParameterFormService cache (form structure analysis)
+    # This is the expensive part that builds the recursive FormStructure
+    if dataclasses.is_dataclass(config_type):
+        # Extract parameters from the dataclass
+        params = {}
+        param_types = {}
+        for field in dataclasses.fields(config_type):
+            params[field.name] = None  # Dummy value
+            param_types[field.name] = field.type
+
+        # Analyze to warm the cache
+        service.analyze_parameters(
+            params, param_types,
+            field_id='cache_warming',
+            parameter_info=param_info,
+            parent_dataclass_type=config_type
+        )
+
+    _prewarmed_config_types.add(config_type)
+
+
+def prewarm_config_analysis_cache(base_config_type: Type, max_workers: Optional[int] = None) -> None:
     """
     Pre-warm analysis caches for all config types in a hierarchy.
 
@@ -103,15 +216,24 @@ def prewarm_config_analysis_cache(base_config_type: Type) -> None:
     4. Eliminates 1000ms+ first-load penalty when opening config windows
 
     After this runs, first load is as fast as second load (~170ms instead of ~1000ms).
+    Types already warmed in this process are skipped, so repeated calls are cheap.
 
     Args:
         base_config_type: Root configuration type (e.g., GlobalPipelineConfig)
+        max_workers: If greater than 1, analyze config types concurrently on a
+                     thread pool of this size (each worker gets its own
+                     ParameterFormService), one nesting level at a time so
+                     nested configs still finish before their parents.
+                     Defaults to sequential analysis.
 
     Example:
         >>> from myapp.config import GlobalConfig
         >>> from hieraconf import prewarm_config_analysis_cache
         >>> prewarm_config_analysis_cache(GlobalConfig)
     """
+    # Fail before discovery if the analyzers are unavailable
+    _, _, ParameterFormService = _get_analyzers()
+
     # Discover all dataclass types in the hierarchy using introspection
     config_types = _extract_all_dataclass_types(base_config_type)
 
@@ -126,34 +248,40 @@ def prewarm_config_analysis_cache(base_config_type: Type) -> None:
         if lazy_type is not None and dataclasses.is_dataclass(lazy_type):
             config_types.add(lazy_type)
 
-    # Create a single service instance to warm the class-level cache
-    service = ParameterFormService()
+    # Analysis results depend only on the type, so types warmed by an earlier
+    # call (e.g. a shared nested config) are not analyzed again
+    config_types -= _prewarmed_config_types
+    if not config_types:
+        logger.debug("Analysis cache already warm for %s", base_config_type.__name__)
+        return
 
-    # Pre-analyze all config types to populate caches
-    for config_type in config_types:
-        # Warm SignatureAnalyzer cache (dataclass field analysis)
-        SignatureAnalyzer._analyze_dataclass(config_type)
-
-        # Warm UnifiedParameterAnalyzer cache (parameter info with descriptions)
-        param_info = UnifiedParameterAnalyzer.analyze(config_type)
-
-        # Warm ParameterFormService cache (form structure analysis)
-        # This is the expensive part that builds the recursive FormStructure
-        if dataclasses.is_dataclass(config_type):
-            # Extract parameters from the dataclass
-            params = {}
-            param_types = {}
-            for field in dataclasses.fields(config_type):
-                params[field.name] = None  # Dummy value
-                param_types[field.name] = field.type
-
-            # Analyze to warm the cache
-            service.analyze_parameters(
-                params, param_types,
-                field_id='cache_warming',
-                parameter_info=param_info,
-                parent_dataclass_type=config_type
-            )
+    # Analyze nested configs before their parents so parent analysis reuses them
+    levels = _nested_first_levels(config_types)
 
-    logger.debug(f"Pre-warmed analysis cache for {len(config_types)} config types")
+    if max_workers is not None and max_workers > 1 and len(config_types) > 1:
+        # Types are analyzed independently; per-thread services avoid sharing
+        # instance state while the class-level caches they fill are shared
+        from concurrent.futures import ThreadPoolExecutor
+        worker_services = threading.local()
+
+        def warm(config_type: Type) -> None:
+            service = getattr(worker_services, 'service', None)
+            if service is None:
+                service = worker_services.service = ParameterFormService()
+            _prewarm_config_type(config_type, service)
 
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(config_types))) as executor:
+            # Each level finishes before the next starts, keeping the nested-first
+            # order; list() re-raises the first analysis error, like the sequential path
+            for level in levels:
+                list(executor.map(warm, level))
+    else:
+        # Create a single service instance to warm the class-level cache
+        service = ParameterFormService()
+
+        # Pre-analyze all config types to populate caches
+        for level in levels:
+            for config_type in level:
+                _prewarm_config_type(config_type, service)
+
+    logger.debug(f"Pre-warmed analysis cache for {len(config_types)} config types")
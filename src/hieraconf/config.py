@@ -36,6 +36,10 @@ def set_base_config_type(config_type: Type) -> None:
     global _base_config_type
     _base_config_type = config_type
 
+    # Build the per-class merge caches now rather than on the first config_context
+    from hieraconf.context_manager import _prewarm_context_caches
+    _prewarm_context_caches(config_type)
+
 
 def get_base_config_type() -> Type:
     """
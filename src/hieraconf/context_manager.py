@@ -22,9 +22,13 @@ import dataclasses
 import inspect
 import logging
 from contextlib import contextmanager
-from typing import Any, Dict, Union
+from functools import lru_cache
+from typing import Any, Dict, Tuple, Union, get_type_hints
 from dataclasses import fields, is_dataclass
 
+from hieraconf import config as framework_config
+from hieraconf.config import get_base_config_type
+
 logger = logging.getLogger(__name__)
 
 # Core contextvar for current merged global config
@@ -32,6 +36,166 @@ logger = logging.getLogger(__name__)
 current_temp_global = contextvars.ContextVar('current_temp_global')
 
 
+# Sentinel for "attribute not present" in raw instance-dict lookups
+_MISSING = object()
+
+
+def _instance_dict(obj) -> Dict[str, Any]:
+    """
+    Get obj's instance __dict__ without triggering lazy resolution.
+
+    Returns an empty dict for slotted objects so callers fall back to
+    object.__getattribute__ for every name.
+    """
+    try:
+        return object.__getattribute__(obj, '__dict__')
+    except AttributeError:
+        return {}
+
+
+@lru_cache(maxsize=None)
+def _cached_field_names(cls) -> Tuple[str, ...]:
+    """
+    Get the dataclass field names of cls, computed once per class.
+
+    dataclasses.fields() rebuilds its tuple on every call; the field set of a
+    dataclass never changes after creation, so merge paths use this instead.
+    """
+    return tuple(f.name for f in fields(cls))
+
+
+# Merge plan kinds, classified once per base config field from its annotation
+_GENERIC_FIELD = 0    # Annotation gives no shortcut; decide from the value
+_SCALAR_FIELD = 1     # Plain non-dataclass class; exact-type values are used as-is
+_DATACLASS_FIELD = 2  # Nested config annotation
+
+
+@lru_cache(maxsize=None)
+def _merge_plan(base_config_type) -> Tuple[Tuple[str, Any, int], ...]:
+    """
+    Get (field_name, expected_type, kind) for every field of base_config_type.
+
+    The base schema is fixed, so annotation-level decisions are made once per
+    type and config_context only does value-dependent work per entry.
+    """
+    unwrapped_types = dict(_config_field_types(base_config_type))
+    plan = []
+    for field_info in fields(base_config_type):
+        field_type = unwrapped_types[field_info.name]
+        if is_dataclass(field_type):
+            kind = _DATACLASS_FIELD
+        elif isinstance(field_type, type) and field_type is not object:
+            kind = _SCALAR_FIELD
+        else:
+            kind = _GENERIC_FIELD
+        plan.append((field_info.name, field_info.type, kind))
+    return tuple(plan)
+
+
+@lru_cache(maxsize=1024)
+def _matching_merge_plan(obj_type, base_config_type) -> Tuple[Tuple[str, Any, int], ...]:
+    """
+    Get the merge plan entries for base config fields that dataclass obj_type carries.
+
+    Computed once per (obj_type, base_config_type) pair so config_context only
+    visits the intersection instead of probing every base field per entry.
+    """
+    obj_fields = obj_type.__dataclass_fields__
+    return tuple(
+        entry for entry in _merge_plan(base_config_type)
+        if entry[0] in obj_fields or hasattr(obj_type, entry[0])
+    )
+
+
+@lru_cache(maxsize=256)
+def _class_attribute_candidates(cls) -> Tuple[str, ...]:
+    """
+    Get class-level attribute names on cls that can yield config instances.
+
+    Covers what dir() exposes beyond the instance __dict__ - properties, slots
+    and class-level dataclass values - while skipping methods. Walking the MRO
+    namespace is the expensive part of dir(), so it is done once per class.
+    """
+    names = []
+    for name in dir(cls):
+        try:
+            raw_value = inspect.getattr_static(cls, name)
+        except AttributeError:
+            continue
+        if inspect.isroutine(raw_value) or isinstance(raw_value, (staticmethod, classmethod)):
+            continue
+        if is_dataclass(raw_value) or hasattr(type(raw_value), '__get__'):
+            names.append(name)
+    return tuple(names)
+
+
+def _attribute_names(obj):
+    """
+    Get the attribute names dir(obj) would list that may hold config instances.
+
+    Instance attributes come straight from __dict__; class-level candidates are
+    cached per type. Objects with a custom __dir__ still go through dir().
+    """
+    obj_type = type(obj)
+    if obj_type.__dir__ is not object.__dir__:
+        return dir(obj)
+
+    names = set(_class_attribute_candidates(obj_type))
+    instance_dict = getattr(obj, '__dict__', None)
+    if instance_dict:
+        names.update(instance_dict)
+    # dir() order is sorted; keep it so later same-typed attributes still win
+    return sorted(names)
+
+
+@lru_cache(maxsize=None)
+def _supports_dict_replace(cls) -> bool:
+    """
+    Check whether replacing fields on cls instances can skip __init__.
+
+    True when construction only assigns fields: __init__ is the one dataclass
+    generated, there is no __post_init__, and every field is an init field.
+    @dataclass keeps a hand-written __init__ (same qualname, params.init still
+    true), so the generated one is recognized by its exec'd '<string>' code.
+    """
+    params = cls.__dict__.get('__dataclass_params__')
+    init = cls.__dict__.get('__init__')
+    init_code = getattr(init, '__code__', None)
+    return (
+        params is not None
+        and params.init
+        and getattr(init, '__qualname__', None) == f"{cls.__qualname__}.__init__"
+        and init_code is not None
+        and init_code.co_filename == '<string>'
+        and not hasattr(cls, '__post_init__')
+        and all(f.init for f in fields(cls))
+    )
+
+
+def _replace(instance, changes: Dict[str, Any]):
+    """
+    Equivalent of dataclasses.replace for merge paths.
+
+    Instances whose class supports it are copied at the instance-dict level,
+    avoiding a full keyword __init__ call per context entry; anything else
+    goes through dataclasses.replace.
+    """
+    cls = type(instance)
+    if _supports_dict_replace(cls):
+        instance_values = _instance_dict(instance)
+        if len(instance_values) == len(cls.__dataclass_fields__):
+            for name in changes:
+                if name not in instance_values:
+                    break
+            else:
+                replaced = object.__new__(cls)
+                replaced_values = object.__getattribute__(replaced, '__dict__')
+                replaced_values.update(instance_values)
+                replaced_values.update(changes)
+                return replaced
+    return dataclasses.replace(instance, **changes)
+
+
 def _merge_nested_dataclass(base, override, mask_with_none: bool = False):
     """
     Recursively merge nested dataclass fields.
@@ -53,10 +217,22 @@ def _merge_nested_dataclass(base, override, mask_with_none: bool = False):
     if not is_dataclass(base) or not is_dataclass(override):
         return override
 
+    field_names = _cached_field_names(type(override))
+
+    # Common inheritance case: an all-None override contributes nothing, so skip
+    # the merge loop with one scan over the instance dict
+    override_values = _instance_dict(override)
+    if not mask_with_none and all(
+        name in override_values and override_values[name] is None for name in field_names
+    ):
+        return base
+
     merge_values = {}
-    for field_info in fields(override):
-        field_name = field_info.name
-        override_value = object.__getattribute__(override, field_name)
+    for field_name in field_names:
+        # Dataclass fields live in the instance dict; descriptors and slots don't
+        override_value = override_values.get(field_name, _MISSING)
+        if override_value is _MISSING:
+            override_value = object.__getattribute__(override, field_name)
 
         if override_value is None:
             if mask_with_none:
@@ -78,11 +254,51 @@ def _merge_nested_dataclass(base, override, mask_with_none: bool = False):
 
     # Merge with base
     if merge_values:
-        return dataclasses.replace(base, **merge_values)
+        return _replace(base, merge_values)
     else:
         return base
 
 
+def _prewarm_context_caches(config_type) -> None:
+    """
+    Populate the per-class caches used by config_context for config_type.
+
+    Walks config_type and every dataclass type reachable through its
+    config-typed fields, so the first context entry doesn't pay for field,
+    annotation and merge plan introspection. Non-dataclass types are ignored.
+    """
+    if not isinstance(config_type, type) or not is_dataclass(config_type):
+        return
+
+    _merge_plan(config_type)
+    pending = [config_type]
+    seen = set()
+    while pending:
+        cls = pending.pop()
+        if cls in seen:
+            continue
+        seen.add(cls)
+        _cached_field_names(cls)
+        for _, field_type in _config_field_types(cls):
+            if isinstance(field_type, type) and is_dataclass(field_type):
+                pending.append(field_type)
+        _dataclass_field_names(cls)
+
+
+def _merge_field(base_config, field_name: str, value, mask_with_none: bool):
+    """
+    Get the override for field_name, merging nested configs into the base value.
+
+    CRITICAL: nested dataclass values are merged with the base config's value
+    instead of replacing it wholesale; anything else is used as-is.
+    """
+    if is_dataclass(value):
+        base_value = getattr(base_config, field_name, None)
+        if base_value is not None and is_dataclass(base_value):
+            return _merge_nested_dataclass(base_value, value, mask_with_none=mask_with_none)
+    return value
+
+
 @contextmanager
 def config_context(obj, mask_with_none: bool = False):
     """
@@ -115,72 +331,87 @@ def config_context(obj, mask_with_none: bool = False):
     # Find matching fields between obj and base config type
     overrides = {}
     if obj is not None:
-        from hieraconf.config import get_base_config_type
-
-        base_config_type = get_base_config_type()
+        # Read the configured type directly; only fall back to the accessor
+        # (which raises with setup guidance) when nothing has been configured
+        base_config_type = framework_config._base_config_type
+        if base_config_type is None:
+            base_config_type = get_base_config_type()
+
+        # Dataclass field sets are fixed per type, so the field/class-attribute
+        # intersection is cached; arbitrary objects (orchestrators, steps) still
+        # need per-instance probing
+        obj_type = type(obj)
+        obj_values = _instance_dict(obj)
+        if is_dataclass(obj_type):
+            matching_plan = _matching_merge_plan(obj_type, base_config_type)
+            # Attributes set outside the fields (e.g. in __post_init__) merge too
+            extra_names = obj_values.keys() - obj_type.__dataclass_fields__.keys()
+            if extra_names:
+                matching_plan += tuple(
+                    entry for entry in _merge_plan(base_config_type)
+                    if entry[0] in extra_names and entry not in matching_plan
+                )
+        else:
+            matching_plan = tuple(
+                entry for entry in _merge_plan(base_config_type) if hasattr(obj, entry[0])
+            )
+
+        for field_name, expected_type, kind in matching_plan:
+            # Read raw values to avoid triggering lazy resolution; properties
+            # and slots aren't in the instance dict, so use object.__getattribute__
+            value = obj_values.get(field_name, _MISSING)
+            if value is _MISSING:
+                try:
+                    value = object.__getattribute__(obj, field_name)
+                except AttributeError:
+                    continue
 
-        for field_info in fields(base_config_type):
-            field_name = field_info.name
-            expected_type = field_info.type
+            if value is None:
+                # CRITICAL: When mask_with_none=True, None values override base config
+                # This allows static defaults to mask loaded instance values
+                if mask_with_none:
+                    overrides[field_name] = None
+                continue
 
-            # Check if obj has this field
-            try:
-                # Use object.__getattribute__ to avoid triggering lazy resolution
-                if hasattr(obj, field_name):
-                    value = object.__getattribute__(obj, field_name)
-                    # CRITICAL: When mask_with_none=True, None values override base config
-                    # This allows static defaults to mask loaded instance values
-                    if value is not None or mask_with_none:
-                        # When masking with None, always include the value (even if None)
-                        if mask_with_none:
-                            # For nested dataclasses, merge with mask_with_none=True
-                            if is_dataclass(value):
-                                base_value = getattr(base_config, field_name, None)
-                                if base_value is not None and is_dataclass(base_value):
-                                    merged_nested = _merge_nested_dataclass(base_value, value, mask_with_none=True)
-                                    overrides[field_name] = merged_nested
-                                else:
-                                    overrides[field_name] = value
-                            else:
-                                overrides[field_name] = value
-                        # Normal mode: only include non-None values
-                        elif value is not None:
-                            # Check if value is compatible (handles lazy-to-base type mapping)
-                            if _is_compatible_config_type(value, expected_type):
-                                # Convert lazy configs to base configs for context
-                                if hasattr(value, 'to_base_config'):
-                                    value = value.to_base_config()
-
-                                # CRITICAL FIX: Recursively merge nested dataclass fields
-                                # If this is a dataclass field, merge it with the base config's value
-                                # instead of replacing wholesale
-                                if is_dataclass(value):
-                                    base_value = getattr(base_config, field_name, None)
-                                    if base_value is not None and is_dataclass(base_value):
-                                        # Merge nested dataclass: base + overrides
-                                        # Pass mask_with_none to recursive merge
-                                        merged_nested = _merge_nested_dataclass(base_value, value, mask_with_none=False)
-                                        overrides[field_name] = merged_nested
-                                    else:
-                                        # No base value to merge with, use override as-is
-                                        overrides[field_name] = value
-                                else:
-                                    # Non-dataclass field, use override as-is
-                                    overrides[field_name] = value
-            except AttributeError:
+            # Exact-type values of plain annotated fields are compatible and
+            # can't be nested configs, so they need no further checks
+            if kind == _SCALAR_FIELD and type(value) is expected_type:
+                overrides[field_name] = value
                 continue
 
+            if not mask_with_none:
+                # Normal mode: check if value is compatible (handles lazy-to-base type mapping)
+                if not _is_compatible_config_type(value, expected_type):
+                    continue
+                # Convert lazy configs to base configs for context
+                if hasattr(value, 'to_base_config'):
+                    try:
+                        value = value.to_base_config()
+                    except AttributeError:
+                        continue
+
+            overrides[field_name] = _merge_field(base_config, field_name, value, mask_with_none)
+
+    # Drop overrides that are already the base config's values (e.g. nested
+    # contexts re-entering the same config) so no-op entries skip replace()
+    if overrides:
+        base_values = _instance_dict(base_config)
+        overrides = {
+            name: value for name, value in overrides.items()
+            if base_values.get(name, _MISSING) is not value
+        }
+
     # Create merged config if we have overrides
     if overrides:
         try:
-            merged_config = dataclasses.replace(base_config, **overrides)
-            logger.debug(f"Creating config context with {len(overrides)} field overrides from {type(obj).__name__}")
+            merged_config = _replace(base_config, overrides)
+            logger.debug("Creating config context with %d field overrides from %s", len(overrides), type(obj).__name__)
         except Exception as e:
             logger.warning(f"Failed to merge config overrides from {type(obj).__name__}: {e}")
             merged_config = base_config
     else:
         merged_config = base_config
-        logger.debug(f"Creating config context with no overrides from {type(obj).__name__}")
+        logger.debug("Creating config context with no overrides from %s", type(obj).__name__)
 
     token = current_temp_global.set(merged_config)
     try:
@@ -211,14 +442,14 @@ def extract_from_function_signature(func) -> Dict[str, Any]:
         overrides = {}
         
         for name, param in sig.parameters.items():
-            if param.default != inspect.Parameter.empty:
+            if param.default is not inspect.Parameter.empty:
                 overrides[name] = param.default
                 
-        logger.debug(f"Extracted {len(overrides)} overrides from function {func.__name__}")
+        logger.debug("Extracted %d overrides from function %s", len(overrides), func.__name__)
         return overrides
         
     except (ValueError, TypeError) as e:
-        logger.debug(f"Could not extract signature from {func}: {e}")
+        logger.debug("Could not extract signature from %s: %s", func, e)
         return {}
 
 
@@ -245,7 +476,7 @@ def extract_from_dataclass_fields(obj) -> Dict[str, Any]:
         if value is not None:
             overrides[field.name] = value
             
-    logger.debug(f"Extracted {len(overrides)} overrides from dataclass {type(obj).__name__}")
+    logger.debug("Extracted %d overrides from dataclass %s", len(overrides), type(obj).__name__)
     return overrides
 
 
@@ -265,7 +496,7 @@ def extract_from_object_attributes(obj) -> Dict[str, Any]:
     overrides = {}
     
     try:
-        for attr_name in dir(obj):
+        for attr_name in _attribute_names(obj):
             if attr_name.endswith('_config'):
                 attr_value = getattr(obj, attr_name)
                 if attr_value is not None and is_dataclass(attr_value):
@@ -273,10 +504,10 @@ def extract_from_object_attributes(obj) -> Dict[str, Any]:
                     config_overrides = extract_from_dataclass_fields(attr_value)
                     overrides.update(config_overrides)
                     
-        logger.debug(f"Extracted {len(overrides)} overrides from object {type(obj).__name__}")
+        logger.debug("Extracted %d overrides from object %s", len(overrides), type(obj).__name__)
         
     except Exception as e:
-        logger.debug(f"Error extracting from object {obj}: {e}")
+        logger.debug("Error extracting from object %s: %s", obj, e)
         
     return overrides
 
@@ -299,16 +530,22 @@ def merge_configs(base, overrides: Dict[str, Any]):
         return base
         
     try:
-        # Filter out None values - they should not override existing values
-        filtered_overrides = {k: v for k, v in overrides.items() if v is not None}
-        
+        if len(overrides) == 1:
+            # Single-override fast path (typical step execution): the caller's
+            # dict can be passed through unless its one value is None
+            (override_value,) = overrides.values()
+            filtered_overrides = overrides if override_value is not None else None
+        else:
+            # Filter out None values - they should not override existing values
+            filtered_overrides = {k: v for k, v in overrides.items() if v is not None}
+
         if not filtered_overrides:
             return base
             
         # Use dataclasses.replace to create new instance with overrides
         merged = dataclasses.replace(base, **filtered_overrides)
         
-        logger.debug(f"Merged {len(filtered_overrides)} overrides into {type(base).__name__}")
+        logger.debug("Merged %d overrides into %s", len(filtered_overrides), type(base).__name__)
         return merged
         
     except Exception as e:
@@ -442,45 +679,115 @@ def extract_all_configs(context_obj) -> Dict[str, Any]:
         return {}
 
     configs = {}
+    context_type = type(context_obj)
 
     # Include the context object itself if it's a dataclass
     if is_dataclass(context_obj):
-        configs[type(context_obj).__name__] = context_obj
+        configs[context_type.__name__] = context_obj
 
     # Type-driven extraction: Use dataclass field annotations to find config fields
-    if is_dataclass(type(context_obj)):
-        for field_info in fields(type(context_obj)):
-            field_type = field_info.type
-            field_name = field_info.name
-
-            # Handle Optional[ConfigType] annotations
-            actual_type = _unwrap_optional_type(field_type)
+    if is_dataclass(context_type):
+        # Plain dataclasses keep field values in the instance dict; lazy ones
+        # must go through getattr so their fields resolve
+        if context_type.__getattribute__ is object.__getattribute__:
+            field_values = _instance_dict(context_obj)
+        else:
+            field_values = {}
 
-            # Only process fields that are dataclass types (config objects)
-            if is_dataclass(actual_type):
+        # Only process fields that are dataclass types (config objects)
+        for field_name in _dataclass_field_names(context_type):
+            field_value = field_values.get(field_name, _MISSING)
+            if field_value is _MISSING:
                 try:
                     field_value = getattr(context_obj, field_name)
-                    if field_value is not None:
-                        # Use the actual instance type, not the annotation type
-                        # This handles cases where field is annotated as base class but contains subclass
-                        instance_type = type(field_value)
-                        configs[instance_type.__name__] = field_value
-
-                        logger.debug(f"Extracted config {instance_type.__name__} from field {field_name}")
-
                 except AttributeError:
                     # Field doesn't exist on instance (shouldn't happen with dataclasses)
-                    logger.debug(f"Field {field_name} not found on {type(context_obj).__name__}")
+                    logger.debug("Field %s not found on %s", field_name, context_type.__name__)
                     continue
 
+            if field_value is not None:
+                # Use the actual instance type, not the annotation type
+                # This handles cases where field is annotated as base class but contains subclass
+                instance_type_name = type(field_value).__name__
+                configs[instance_type_name] = field_value
+
+                logger.debug("Extracted config %s from field %s", instance_type_name, field_name)
+
     # For non-dataclass objects (orchestrators, etc.), extract dataclass attributes
     else:
         _extract_from_object_attributes_typed(context_obj, configs)
 
-    logger.debug(f"Extracted {len(configs)} configs: {list(configs.keys())}")
+    logger.debug("Extracted %d configs: %s", len(configs), configs.keys())
+    return configs
+
+
+# Most recent (context object, extracted configs) pair, see _extract_all_configs_cached
+_last_extracted_configs: Tuple[Any, Any] = (None, None)
+
+
+@lru_cache(maxsize=256)
+def _is_snapshot_context_type(cls) -> bool:
+    """Check whether extract_all_configs results for instances of cls can never change."""
+    return (is_dataclass(cls) and cls.__dataclass_params__.frozen
+            and cls.__getattribute__ is object.__getattribute__)
+
+
+def _extract_all_configs_cached(context_obj) -> Dict[str, Any]:
+    """
+    extract_all_configs, memoized for the most recent context object.
+
+    Lazy attribute access extracts configs from the same merged context on every
+    resolution. Frozen plain dataclass contexts always extract to the same
+    configs, so their result is reused while the context stays current; any
+    other context is extracted afresh. Callers must not mutate the result.
+    """
+    global _last_extracted_configs
+    cached_context, cached_configs = _last_extracted_configs
+    if cached_context is context_obj and cached_configs is not None:
+        return cached_configs
+
+    configs = extract_all_configs(context_obj)
+    if _is_snapshot_context_type(type(context_obj)):
+        _last_extracted_configs = (context_obj, configs)
     return configs
 
 
+@lru_cache(maxsize=256)
+def _config_field_types(cls) -> Tuple[Tuple[str, Any], ...]:
+    """
+    Get (field_name, unwrapped_type) for every field of dataclass cls.
+
+    String annotations (from __future__ import annotations) are resolved once
+    via get_type_hints; fields that can't be resolved keep their raw annotation.
+    """
+    try:
+        type_hints = get_type_hints(cls)
+    except Exception:
+        type_hints = {}
+
+    field_types = []
+    for field_info in fields(cls):
+        field_type = type_hints.get(field_info.name, field_info.type)
+        try:
+            # Handle Optional[ConfigType] annotations
+            actual_type = _unwrap_optional_type(field_type)
+        except TypeError:
+            # Unhashable annotation - unwrap without the cache
+            actual_type = _unwrap_optional_type.__wrapped__(field_type)
+        field_types.append((field_info.name, actual_type))
+    return tuple(field_types)
+
+
+@lru_cache(maxsize=256)
+def _dataclass_field_names(cls) -> Tuple[str, ...]:
+    """Get the names of cls's fields annotated with (optional) dataclass types."""
+    return tuple(
+        field_name for field_name, actual_type in _config_field_types(cls)
+        if is_dataclass(actual_type)
+    )
+
+
+@lru_cache(maxsize=1024)
 def _unwrap_optional_type(field_type):
     """
     Unwrap Optional[T] and Union[T, None] types to get the actual type T.
@@ -507,22 +814,23 @@ def _extract_from_object_attributes_typed(obj, configs: Dict[str, Any]) -> None:
     """
     try:
         # Get all attributes that are dataclass instances
-        for attr_name in dir(obj):
+        for attr_name in _attribute_names(obj):
             if attr_name.startswith('_'):
                 continue
 
             try:
                 attr_value = getattr(obj, attr_name)
                 if attr_value is not None and is_dataclass(attr_value):
-                    configs[type(attr_value).__name__] = attr_value
-                    logger.debug(f"Extracted config {type(attr_value).__name__} from attribute {attr_name}")
+                    attr_type_name = type(attr_value).__name__
+                    configs[attr_type_name] = attr_value
+                    logger.debug("Extracted config %s from attribute %s", attr_type_name, attr_name)
 
             except (AttributeError, TypeError):
                 # Skip attributes that can't be accessed or aren't relevant
                 continue
 
     except Exception as e:
-        logger.debug(f"Error in typed attribute extraction: {e}")
+        logger.debug("Error in typed attribute extraction: %s", e)
 
 
 def _is_compatible_config_type(value, expected_type) -> bool:
@@ -534,10 +842,23 @@ def _is_compatible_config_type(value, expected_type) -> bool:
     - value is a subclass of the expected type
     - value is exactly the expected type
     """
-    value_type = type(value)
+    try:
+        return _is_compatible_type_pair(type(value), expected_type)
+    except TypeError:
+        # Unhashable annotation - check without the cache
+        return _is_compatible_type_pair.__wrapped__(type(value), expected_type)
+
 
+@lru_cache(maxsize=2048)
+def _is_compatible_type_pair(value_type, expected_type) -> bool:
+    """
+    Type-level compatibility check behind _is_compatible_config_type.
+
+    Compatibility depends only on the two types and the lazy type registry, so
+    results are memoized; register_lazy_type_mapping clears the cache.
+    """
     # Direct type match
-    if value_type == expected_type:
+    if value_type is expected_type:
         return True
 
     # Check if value_type is a subclass of expected_type
@@ -549,11 +870,11 @@ def _is_compatible_config_type(value, expected_type) -> bool:
         pass
 
     # Check lazy-to-base type mapping
-    if hasattr(value, 'to_base_config'):
-        # This is a lazy config - check if its base type matches expected_type
-        from hieraconf.lazy_factory import _lazy_type_registry
-        base_type = _lazy_type_registry.get(value_type)
-        if base_type == expected_type:
+    if hasattr(value_type, 'to_base_config'):
+        # This is a lazy config - check if its base type matches expected_type.
+        # Read the class's own dict so unregistered subclasses don't inherit it
+        base_type = value_type.__dict__.get('_base_type')
+        if base_type is expected_type:
             return True
         # Also check if base type is subclass of expected type
         if base_type and issubclass(base_type, expected_type):
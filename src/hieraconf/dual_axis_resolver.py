@@ -8,233 +8,140 @@ The resolver is completely generic and has no application-specific dependencies.
 """
 
 import logging
-from typing import Any, Dict, Type, Optional
+import operator
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Tuple, Type, Optional
 from dataclasses import is_dataclass
 
 logger = logging.getLogger(__name__)
 
+# Fields whose resolution steps are traced at DEBUG level
+_TRACED_FIELDS = frozenset({'output_dir_suffix', 'sub_dir', 'well_filter'})
 
-def _has_concrete_field_override(source_class, field_name: str) -> bool:
-    """
-    Check if a class has a concrete field override (not None).
+# Sentinel for fields absent from an instance __dict__
+_MISSING = object()
 
-    This determines inheritance design based on static class definition:
-    - Concrete default (not None) = never inherits
-    - None default = always inherits (inherit_as_none design)
-    """
-    # CRITICAL FIX: Check class attribute directly, not dataclass field default
-    # The @global_pipeline_config decorator modifies field defaults to None
-    # but the class attribute retains the original concrete value
-    if hasattr(source_class, field_name):
-        class_attr_value = getattr(source_class, field_name)
-        has_override = class_attr_value is not None
-        return has_override
-    return False
 
+@lru_cache(maxsize=None)
+def _dataclass_mro(cls: Type) -> Tuple[Type, ...]:
+    """Get the dataclass classes in cls's MRO, most specific first, computed once per class."""
+    return tuple(mro_class for mro_class in cls.__mro__ if is_dataclass(mro_class))
 
-# Priority functions removed - MRO-based resolution is sufficient
 
+@lru_cache(maxsize=None)
+def _frozen_field_names(cls: Type) -> Optional[FrozenSet[str]]:
+    """Get the field names of a frozen dataclass type, or None for any other type."""
+    params = getattr(cls, '__dataclass_params__', None)
+    if params is None or not params.frozen:
+        return None
+    return frozenset(cls.__dataclass_fields__)
 
-def resolve_field_inheritance_old(
-    obj,
-    field_name: str,
-    available_configs: Dict[str, Any]
-) -> Any:
+
+@lru_cache(maxsize=None)
+def _slot_field_names(cls: Type) -> Optional[FrozenSet[str]]:
     """
-    Pure function for cross-dataclass inheritance resolution.
-    
-    This replaces the complex RecursiveContextualResolver with explicit parameter passing.
-    
-    Args:
-        obj: The object requesting field resolution
-        field_name: Name of the field to resolve
-        available_configs: Dict mapping config type names to config instances
-                          e.g., {'GlobalPipelineConfig': global_config, 'StepConfig': step_config}
-    
-    Returns:
-        Resolved field value or None if not found
-    
-    Algorithm:
-    1. Check if obj has concrete value for field_name
-    2. Check Y-axis inheritance within obj's MRO for concrete values
-    3. Check related config types in available_configs for cross-dataclass inheritance
-    4. Return class defaults as final fallback
+    Get the union of __slots__ across cls's MRO, or None if instances have a __dict__.
+
+    For slotted classes (e.g. @dataclass(slots=True)) this is the complete set of
+    per-instance attribute names.
     """
-    obj_type = type(obj)
+    slot_names = set()
+    for mro_class in cls.__mro__:
+        if mro_class is object:
+            continue
+        slots = mro_class.__dict__.get('__slots__')
+        if slots is None:
+            return None
+        slot_names.update((slots,) if isinstance(slots, str) else slots)
+    if '__dict__' in slot_names:
+        return None
+    return frozenset(slot_names)
+
+
+@lru_cache(maxsize=None)
+def _is_absent_attribute(cls: Type, field_name: str) -> bool:
+    """Check whether instances of a slotted cls can never have field_name, so probes can skip it."""
+    slot_names = _slot_field_names(cls)
+    if slot_names is None or field_name in slot_names:
+        return False
+    return not hasattr(cls, field_name)
 
-    # Step 1: Check concrete value in merged context for obj's type (HIGHEST PRIORITY)
-    # CRITICAL: Context values take absolute precedence over inheritance blocking
-    # The config_context() manager merges concrete values into available_configs
-    for config_name, config_instance in available_configs.items():
-        if type(config_instance) == obj_type:
-            try:
-                # Use object.__getattribute__ to avoid triggering lazy __getattribute__ recursion
-                value = object.__getattribute__(config_instance, field_name)
-                if value is not None:
-                    if field_name == 'well_filter':
-                        logger.debug(f"🔍 CONTEXT: Found concrete value in merged context {obj_type.__name__}.{field_name}: {value}")
-                    return value
-            except AttributeError:
-                # Field doesn't exist on this config type
-                continue
 
-    # Step 1b: Check concrete value on obj instance itself (fallback)
-    # Use object.__getattribute__ to avoid recursion with lazy __getattribute__
+def _instance_values(config_instance) -> Optional[Dict[str, Any]]:
+    """Get config_instance's __dict__ without lazy __getattribute__, or None for slotted instances."""
     try:
-        value = object.__getattribute__(obj, field_name)
-        if value is not None:
-            if field_name == 'well_filter':
-                logger.debug(f"🔍 INSTANCE: Found concrete value on instance {obj_type.__name__}.{field_name}: {value}")
-            return value
+        return object.__getattribute__(config_instance, '__dict__')
     except AttributeError:
-        # Field doesn't exist on the object
-        pass
+        return None
 
-    # Step 2: FIELD-SPECIFIC INHERITANCE BLOCKING
-    # Check if this specific field has a concrete value in the exact same type
-    # Only block inheritance if the EXACT same type has a non-None value
-    for config_name, config_instance in available_configs.items():
-        if type(config_instance) == obj_type:
-            try:
-                field_value = object.__getattribute__(config_instance, field_name)
-                if field_value is not None:
-                    # This exact type has a concrete value - use it, don't inherit
-                    if field_name == 'well_filter':
-                        logger.debug(f"🔍 FIELD-SPECIFIC BLOCKING: {obj_type.__name__}.{field_name} = {field_value} (concrete) - blocking inheritance")
-                    return field_value
-            except AttributeError:
-                continue
-
-    # DEBUG: Log what we're trying to resolve
-    if field_name in ['output_dir_suffix', 'sub_dir', 'well_filter']:
-        logger.debug(f"🔍 RESOLVING {obj_type.__name__}.{field_name} - checking context and inheritance")
-        logger.debug(f"🔍 AVAILABLE CONFIGS: {list(available_configs.keys())}")
-
-    # Step 3: Y-axis inheritance within obj's MRO
-    blocking_class = _find_blocking_class_in_mro(obj_type, field_name)
-    
-    for parent_type in obj_type.__mro__[1:]:
-        if not is_dataclass(parent_type):
-            continue
-            
-        # Check blocking logic
-        if blocking_class and parent_type != blocking_class:
-            continue
-            
-        if blocking_class and parent_type == blocking_class:
-            # Check if blocking class has concrete value in available configs
-            for config_name, config_instance in available_configs.items():
-                if type(config_instance) == parent_type:
-                    try:
-                        # Use object.__getattribute__ to avoid triggering lazy __getattribute__ recursion
-                        value = object.__getattribute__(config_instance, field_name)
-                        if value is None:
-                            # Blocking class has None - inheritance blocked
-                            break
-                        else:
-                            logger.debug(f"Inherited from blocking class {parent_type.__name__}: {value}")
-                            return value
-                    except AttributeError:
-                        # Field doesn't exist on this config type
-                        continue
-            break
-
-        # Normal inheritance - check for concrete values
-        for config_name, config_instance in available_configs.items():
-            if type(config_instance) == parent_type:
-                try:
-                    # Use object.__getattribute__ to avoid triggering lazy __getattribute__ recursion
-                    value = object.__getattribute__(config_instance, field_name)
-                    if field_name in ['output_dir_suffix', 'sub_dir', 'well_filter']:
-                        logger.debug(f"🔍 Y-AXIS INHERITANCE: {parent_type.__name__}.{field_name} = {value}")
-                    if value is not None:
-                        if field_name in ['output_dir_suffix', 'sub_dir', 'well_filter']:
-                            logger.debug(f"🔍 Y-AXIS INHERITANCE: FOUND {parent_type.__name__}.{field_name}: {value} (returning)")
-                        logger.debug(f"Inherited from {parent_type.__name__}: {value}")
-                        return value
-                except AttributeError:
-                    # Field doesn't exist on this config type
-                    continue
-
-    # Step 4: Cross-dataclass inheritance from related config types (MRO-based)
-    # NOTE: Inheritance blocking was already applied in Step 2, so this only runs for types without concrete overrides
-    # Uses pure MRO-based resolution - no custom priority functions needed
-    for config_name, config_instance in available_configs.items():
-        config_type = type(config_instance)
-
-        if _is_related_config_type(obj_type, config_type):
-            # Skip if this is the same type as the requesting object (avoid self-inheritance)
-            if config_type == obj_type:
-                if field_name in ['output_dir_suffix', 'sub_dir', 'well_filter']:
-                    logger.debug(f"🔍 CROSS-DATACLASS: Skipping self-inheritance from {config_type.__name__}")
-                continue
-
-            try:
-                # Use object.__getattribute__ to avoid triggering lazy __getattribute__ recursion
-                value = object.__getattribute__(config_instance, field_name)
-                if field_name in ['output_dir_suffix', 'sub_dir', 'well_filter']:
-                    logger.debug(f"🔍 CROSS-DATACLASS: {config_type.__name__}.{field_name} = {value} (related config)")
-                if value is not None:
-                    if field_name in ['output_dir_suffix', 'sub_dir', 'well_filter']:
-                        logger.debug(f"🔍 CROSS-DATACLASS: FOUND {config_type.__name__}.{field_name}: {value}")
-                    logger.debug(f"Cross-dataclass inheritance from {config_type.__name__}: {value}")
-                    return value
-            except AttributeError:
-                # Field doesn't exist on this config type
-                if field_name in ['output_dir_suffix', 'sub_dir', 'well_filter']:
-                    logger.debug(f"🔍 CROSS-DATACLASS: {config_type.__name__} has no field {field_name}")
-                continue
-        else:
-            if field_name in ['output_dir_suffix', 'sub_dir']:
-                logger.debug(f"🔍 CROSS-DATACLASS: {config_type.__name__} not related to {obj_type.__name__}")
-    
-    # Step 4: Class defaults as final fallback
-    if blocking_class:
-        try:
-            # Use object.__getattribute__ to avoid triggering lazy __getattribute__ recursion
-            class_default = object.__getattribute__(blocking_class, field_name)
-            if class_default is not None:
-                logger.debug(f"Using class default from blocking class {blocking_class.__name__}: {class_default}")
-                return class_default
-        except AttributeError:
-            # Field doesn't exist on blocking class
-            pass
-    
-    logger.debug(f"No resolution found for {obj_type.__name__}.{field_name}")
-    return None
 
+# Index built for the most recently seen available_configs, as
+# (available_configs, snapshot of its values, index, resolved-value memo or None,
+# whether the memo has been considered).
+_last_context_index = None
 
-def _is_related_config_type(obj_type: Type, config_type: Type) -> bool:
-    """
-    Check if config_type is related to obj_type for cross-dataclass inheritance.
 
-    CRITICAL FIX: Only allow inheritance from parent classes or sibling classes at the same level,
-    NOT from child classes. This prevents WellFilterConfig from inheriting from StepWellFilterConfig.
+def _context_index(
+    available_configs: Dict[str, Any]
+) -> Tuple[Dict[Type, List[Tuple[Any, Optional[Dict[str, Any]]]]],
+           Optional[Dict[Tuple[Type, str], Any]]]:
+    """
+    Index available_configs for resolution.
 
-    Args:
-        obj_type: The type requesting field resolution
-        config_type: The type being checked for relationship
+    Returns the config instances grouped by exact type (preserving order) as
+    (instance, instance __dict__ or None) entries, plus a memo of resolved
+    (type, field) results. See _instance_values.
 
-    Returns:
-        True if config_type should be considered for cross-dataclass inheritance
+    The memo only pays off when several fields resolve against the same context,
+    so it is considered the second time the same available_configs is seen. It is
+    only kept when every instance is frozen, since resolution results must not
+    outlive a mutation.
     """
-    # CRITICAL: Only allow inheritance from parent classes (obj_type inherits from config_type)
-    # This prevents base classes from inheriting from their derived classes
-    if issubclass(obj_type, config_type):
-        return True
-
-    # Allow sibling inheritance only if they share a common parent but neither inherits from the other
-    # This allows StepMaterializationConfig to inherit from both StepWellFilterConfig and PathPlanningConfig
-    if not issubclass(config_type, obj_type):  # config_type is NOT a child of obj_type
-        # Check if they share a common dataclass ancestor (excluding themselves)
-        obj_ancestors = set(cls for cls in obj_type.__mro__[1:] if is_dataclass(cls))  # Skip obj_type itself
-        config_ancestors = set(cls for cls in config_type.__mro__[1:] if is_dataclass(cls))  # Skip config_type itself
-
-        shared_ancestors = obj_ancestors & config_ancestors
-        if shared_ancestors:
-            return True
+    global _last_context_index
+    config_values = tuple(available_configs.values())
+    cached = _last_context_index
+    if (cached is not None and cached[0] is available_configs
+            and len(cached[1]) == len(config_values)
+            and all(map(operator.is_, cached[1], config_values))):
+        if cached[4]:
+            return cached[2], cached[3]
+        configs_by_type = cached[2]
+        all_frozen = all(
+            _frozen_field_names(config_type) is not None and instance_values is not None
+            for config_type, entries in configs_by_type.items()
+            for _, instance_values in entries
+        )
+        resolved = {} if all_frozen else None
+        _last_context_index = (available_configs, config_values, configs_by_type, resolved, True)
+        return configs_by_type, resolved
+
+    configs_by_type = {}
+    for config_instance in config_values:
+        configs_by_type.setdefault(type(config_instance), []).append(
+            (config_instance, _instance_values(config_instance)))
+
+    _last_context_index = (available_configs, config_values, configs_by_type, None, False)
+    return configs_by_type, None
+
+
+def _get_field_value(config_instance, instance_values: Optional[Dict[str, Any]], field_name: str) -> Any:
+    """
+    Get config_instance's raw value for field_name, or None if unset or absent.
 
-    return False
+    Dataclass fields are read straight from the instance __dict__; anything else
+    uses object.__getattribute__ to avoid triggering lazy __getattribute__ recursion.
+    """
+    if instance_values is not None:
+        value = instance_values.get(field_name, _MISSING)
+        if value is not _MISSING:
+            return value
+    elif _is_absent_attribute(type(config_instance), field_name):
+        # Slotted instance without this attribute: skip the AttributeError
+        return None
+    try:
+        return object.__getattribute__(config_instance, field_name)
+    except AttributeError:
+        return None
 
 
 def resolve_field_inheritance(
@@ -261,121 +168,134 @@ def resolve_field_inheritance(
     """
     obj_type = type(obj)
 
+    # Index the context once so each MRO step is a dict lookup, not a scan.
+    # Results depend only on (type, field) within a context, so they are memoized
+    configs_by_type, resolved = _context_index(available_configs)
+    if resolved is None:
+        return _resolve_in_context(obj_type, field_name, configs_by_type)
+
+    key = (obj_type, field_name)
+    try:
+        return resolved[key]
+    except KeyError:
+        value = resolved[key] = _resolve_in_context(obj_type, field_name, configs_by_type)
+        return value
+
+
+@lru_cache(maxsize=None)
+def _compile_resolver(obj_type: Type) -> Callable[[str, Dict], Any]:
+    """
+    Build a resolver specialized to obj_type's hierarchy.
+
+    The exact type followed by its dataclass MRO is fixed per class, so steps 1
+    and 2 of resolve_field_inheritance collapse into one walk over a precomputed
+    tuple. Returns resolve(field_name, configs_by_type).
+    """
+    search_order = tuple(dict.fromkeys((obj_type,) + _dataclass_mro(obj_type)))
+
+    def resolve(field_name: str, configs_by_type) -> Any:
+        configs_for_type = configs_by_type.get
+        for mro_class in search_order:
+            for config_instance, instance_values in configs_for_type(mro_class, ()):
+                value = _get_field_value(config_instance, instance_values, field_name)
+                if value is not None:
+                    return value
+
+        # Class defaults as final fallback
+        try:
+            return object.__getattribute__(obj_type, field_name)
+        except AttributeError:
+            return None
+
+    return resolve
+
+
+def _resolve_in_context(obj_type: Type, field_name: str, configs_by_type) -> Any:
+    """
+    Run the resolution steps of resolve_field_inheritance against an indexed context.
+
+    Uses the specialized resolver from _compile_resolver unless the field is traced,
+    in which case each step is logged as it runs.
+    """
+    # Field-specific tracing only; checked once so the hot path skips it entirely
+    if field_name not in _TRACED_FIELDS or not logger.isEnabledFor(logging.DEBUG):
+        return _compile_resolver(obj_type)(field_name, configs_by_type)
+
+    configs_for_type = configs_by_type.get
+    obj_name = obj_type.__name__
+
     # Step 1: Check if exact same type has concrete value in context
-    for config_name, config_instance in available_configs.items():
-        if type(config_instance) == obj_type:
-            try:
-                field_value = object.__getattribute__(config_instance, field_name)
-                if field_value is not None:
-                    if field_name == 'well_filter':
-                        logger.debug(f"🔍 CONCRETE VALUE: {obj_type.__name__}.{field_name} = {field_value}")
-                    return field_value
-            except AttributeError:
-                continue
+    for config_instance, instance_values in configs_for_type(obj_type, ()):
+        field_value = _get_field_value(config_instance, instance_values, field_name)
+        if field_value is not None:
+            logger.debug("🔍 CONCRETE VALUE: %s.%s = %r", obj_name, field_name, field_value)
+            return field_value
 
     # Step 2: MRO-based inheritance - traverse MRO from most to least specific
     # For each class in the MRO, check if there's a config instance in context with concrete value
-    if field_name in ['output_dir_suffix', 'sub_dir', 'well_filter']:
-        logger.debug(f"🔍 MRO-INHERITANCE: Resolving {obj_type.__name__}.{field_name}")
-        logger.debug(f"🔍 MRO-INHERITANCE: MRO = {[cls.__name__ for cls in obj_type.__mro__]}")
-
-    for mro_class in obj_type.__mro__:
-        if not is_dataclass(mro_class):
-            continue
+    logger.debug("🔍 MRO-INHERITANCE: Resolving %s.%s", obj_name, field_name)
+    logger.debug("🔍 MRO-INHERITANCE: MRO = %s", [cls.__name__ for cls in obj_type.__mro__])
 
+    for mro_class in _dataclass_mro(obj_type):
         # Look for a config instance of this MRO class type in the available configs
-        for config_name, config_instance in available_configs.items():
-            if type(config_instance) == mro_class:
-                try:
-                    value = object.__getattribute__(config_instance, field_name)
-                    if field_name in ['output_dir_suffix', 'sub_dir', 'well_filter']:
-                        logger.debug(f"🔍 MRO-INHERITANCE: {mro_class.__name__}.{field_name} = {value}")
-                    if value is not None:
-                        if field_name in ['output_dir_suffix', 'sub_dir', 'well_filter']:
-                            logger.debug(f"🔍 MRO-INHERITANCE: FOUND {mro_class.__name__}.{field_name}: {value} (returning)")
-                        return value
-                except AttributeError:
-                    continue
+        for config_instance, instance_values in configs_for_type(mro_class, ()):
+            value = _get_field_value(config_instance, instance_values, field_name)
+            logger.debug("🔍 MRO-INHERITANCE: %s.%s = %r", mro_class.__name__, field_name, value)
+            if value is not None:
+                logger.debug("🔍 MRO-INHERITANCE: FOUND %s.%s: %r (returning)", mro_class.__name__, field_name, value)
+                return value
 
     # Step 3: Class defaults as final fallback
     try:
         class_default = object.__getattribute__(obj_type, field_name)
         if class_default is not None:
-            if field_name in ['output_dir_suffix', 'sub_dir', 'well_filter']:
-                logger.debug(f"🔍 CLASS-DEFAULT: {obj_type.__name__}.{field_name} = {class_default}")
+            logger.debug("🔍 CLASS-DEFAULT: %s.%s = %r", obj_name, field_name, class_default)
             return class_default
     except AttributeError:
         pass
 
-    if field_name in ['output_dir_suffix', 'sub_dir', 'well_filter']:
-        logger.debug(f"🔍 NO-RESOLUTION: {obj_type.__name__}.{field_name} = None")
+    logger.debug("🔍 NO-RESOLUTION: %s.%s = None", obj_name, field_name)
     return None
 
 
 # Utility functions for inheritance detection (kept from original resolver)
 
+@lru_cache(maxsize=4096)
 def _has_concrete_field_override(config_class: Type, field_name: str) -> bool:
     """
     Check if a class has a concrete field override (not None).
 
     This determines class-level inheritance blocking behavior based on static class definition.
-    Now checks the entire MRO chain to handle inherited fields properly.
+    Now checks the entire MRO chain to handle inherited fields properly: each class's own
+    namespace is read directly, so classes that merely inherit the field are skipped.
+    Memoized per (class, field); the lazy factory clears the cache whenever it
+    rewrites class defaults to None.
     """
-    try:
-        # Check the entire MRO chain for concrete field values
-        for cls in config_class.__mro__:
-            if hasattr(cls, field_name):
-                # Use object.__getattribute__ to avoid triggering lazy __getattribute__ recursion
-                class_attr_value = object.__getattribute__(cls, field_name)
-                if class_attr_value is not None:
-                    has_override = True
-                    logger.debug(f"Class override check {config_class.__name__}.{field_name}: found concrete value {class_attr_value} in {cls.__name__}, has_override={has_override}")
-                    return has_override
-
-        # No concrete value found in any class in the MRO
-        logger.debug(f"Class override check {config_class.__name__}.{field_name}: no concrete value in MRO, has_override=False")
-        return False
-    except AttributeError:
-        # Field doesn't exist on class
-        return False
-
+    for cls in config_class.__mro__:
+        # vars() reads the class namespace without descriptors or lazy __getattribute__
+        class_attr_value = vars(cls).get(field_name)
+        if class_attr_value is not None:
+            logger.debug("Class override check %s.%s: found concrete value %r in %s, has_override=True",
+                         config_class.__name__, field_name, class_attr_value, cls.__name__)
+            return True
 
-def _find_blocking_class_in_mro(base_type: Type, field_name: str) -> Optional[Type]:
-    """
-    Find the first class in MRO that has a concrete field override AND blocks inheritance from parent classes.
+    # No concrete value found in any class in the MRO
+    logger.debug("Class override check %s.%s: no concrete value in MRO, has_override=False",
+                 config_class.__name__, field_name)
+    return False
 
-    A class blocks inheritance only if:
-    1. It has a concrete field override
-    2. There are parent classes in the MRO that also have the same field
 
-    This prevents legitimate inheritance sources (like GlobalPipelineConfig) from being treated as blockers.
+@lru_cache(maxsize=None)
+def _mro_concrete_value(base_class: Type, field_name: str) -> Any:
+    """
+    Get field_name's class-level value from the first class in base_class's MRO with a concrete override.
 
-    Returns:
-        The first class in MRO order that blocks inheritance, or None if no blocking class found.
+    This is the static fallback for lazy fields resolved without a context.
+    Memoized per (class, field) and cleared alongside _has_concrete_field_override.
     """
-    for i, cls in enumerate(base_type.__mro__):
-        if not is_dataclass(cls):
-            continue
+    for cls in base_class.__mro__:
         if _has_concrete_field_override(cls, field_name):
-            # Check if there are parent classes that also have this field
-            has_parent_with_field = False
-            for parent_cls in base_type.__mro__[i + 1:]:
-                if not is_dataclass(parent_cls):
-                    continue
-                try:
-                    # Use object.__getattribute__ to avoid triggering lazy __getattribute__ recursion
-                    object.__getattribute__(parent_cls, field_name)
-                    has_parent_with_field = True
-                    break
-                except AttributeError:
-                    # Field doesn't exist on this parent class
-                    continue
-
-            if has_parent_with_field:
-                logger.debug(f"Found blocking class {cls.__name__} for {base_type.__name__}.{field_name} (blocks parent inheritance)")
-                return cls
-            else:
-                logger.debug(f"Class {cls.__name__} has concrete override but no parents with field - not blocking")
+            return getattr(cls, field_name)
     return None
 
 
@@ -1,16 +1,18 @@
 """
 Generic global configuration context management.
 
-Provides thread-local storage for global configuration state.
+Provides contextvars-based storage for global configuration state, isolated per
+thread and per asyncio task.
 This is used as the base context for all lazy configuration resolution.
 """
 
-import threading
+import contextvars
 from typing import Dict, Type, Optional, Any
 
 
-# Simplified thread-local storage for non-UI usage
-_global_config_contexts: Dict[Type, threading.local] = {}
+# Mapping of config type to its current global instance. The mapping is never
+# mutated in place; setting a config stores a new dict
+_global_configs: contextvars.ContextVar[Dict[Type, Any]] = contextvars.ContextVar('_global_configs', default={})
 
 
 def set_current_global_config(config_type: Type, config_instance: Any, *, caller_context: str = None) -> None:
@@ -24,18 +26,8 @@ def set_current_global_config(config_type: Type, config_instance: Any, *, caller
         config_instance: The config instance to set
         caller_context: Optional context description for debugging inappropriate usage
     """
-    import inspect
-
-    # Get caller information for debugging inappropriate usage
-    frame = inspect.currentframe().f_back
-    caller_file = frame.f_code.co_filename
-    caller_function = frame.f_code.co_name
-    caller_line = frame.f_lineno
-
-    # Set thread-local context
-    if config_type not in _global_config_contexts:
-        _global_config_contexts[config_type] = threading.local()
-    _global_config_contexts[config_type].value = config_instance
+    # Set context-local global config
+    _global_configs.set({**_global_configs.get(), config_type: config_instance})
 
 
 def set_global_config_for_editing(config_type: Type, config_instance: Any) -> None:
@@ -59,5 +51,4 @@ def get_current_global_config(config_type: Type) -> Optional[Any]:
     Returns:
         Current config instance or None
     """
-    context = _global_config_contexts.get(config_type)
-    return getattr(context, 'value', None) if context else None
\ No newline at end of file
+    return _global_configs.get().get(config_type)
\ No newline at end of file
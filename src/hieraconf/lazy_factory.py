@@ -5,12 +5,15 @@ import dataclasses
 import logging
 import re
 import sys
+import weakref
 from abc import ABCMeta
-from dataclasses import dataclass, fields, is_dataclass, make_dataclass, MISSING, field
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union
+from dataclasses import dataclass, fields, is_dataclass, make_dataclass, MISSING, field, Field
+from functools import cached_property, lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, TypeVar, Union
 
 # OpenHCS imports
-from hieraconf.placeholder import LazyDefaultPlaceholderService
+from hieraconf.placeholder import LazyDefaultPlaceholderService, _class_default_placeholders
 # Optional: metaclass_registry for context provider registration
 try:
     from metaclass_registry import AutoRegisterMeta, RegistryConfig
@@ -31,9 +34,115 @@ except ImportError:
 
 # Type registry for lazy dataclass to base class mapping
 _lazy_type_registry: Dict[Type, Type] = {}
+# Reverse index: base class -> first lazy type registered for it
+_base_to_lazy_type: Dict[Type, Type] = {}
 
-# Cache for lazy classes to prevent duplicate creation
-_lazy_class_cache: Dict[str, Type] = {}
+# Default for current_temp_global.get() when no context is set. None is a valid
+# context value, so it can't mark the unset case
+_NO_CONTEXT = object()
+
+# Cache for lazy classes to prevent duplicate creation, keyed by (base_class, lazy_class_name)
+_lazy_class_cache: Dict[Tuple[Type, str], Type] = {}
+
+
+@lru_cache(maxsize=256)
+def _may_have_attribute(obj_type: Type, name: str) -> bool:
+    """
+    Check whether instances of obj_type can have attribute name.
+
+    Only slotted dataclasses without an instance __dict__ are ruled out, when
+    name is neither one of their fields nor a class attribute; any other type
+    may carry arbitrary instance attributes (e.g. set in __post_init__).
+    """
+    if not is_dataclass(obj_type):
+        return True
+    if name in obj_type.__dataclass_fields__ or hasattr(obj_type, name):
+        return True
+    return any('__dict__' in vars(klass) for klass in obj_type.__mro__)
+
+
+def _explicitly_set_fields(self) -> set:
+    """Names of the fields explicitly passed to a lazy instance's constructor."""
+    return set(self._explicitly_set_field_names)
+
+
+@lru_cache(maxsize=None)
+def _lazy_field_map(cls: Type) -> Dict[str, Field]:
+    """
+    Get cls's dataclass fields keyed by name, computed once per class.
+
+    Lazy attribute access checks field membership on every lookup; fields()
+    rebuilds its tuple on each call. Keyed per class rather than stored as a
+    class attribute so subclasses of lazy classes get their own field set.
+    Callers must not mutate the returned dict. Names are interned so membership
+    checks against attribute names compare by identity.
+    """
+    return {sys.intern(f.name): f for f in fields(cls)}
+
+
+@lru_cache(maxsize=None)
+def _dataclass_fields(cls: Type) -> Tuple[Field, ...]:
+    """Get cls's dataclass fields, computed once per class rather than per fields() call."""
+    return fields(cls)
+
+
+@lru_cache(maxsize=None)
+def _field_class_defaults(cls: Type) -> Tuple[Tuple[str, Any], ...]:
+    """Get (field name, class attribute default) pairs for cls's fields, in field order."""
+    return tuple((f.name, getattr(cls, f.name, None)) for f in fields(cls))
+
+
+@lru_cache(maxsize=None)
+def _is_dataclass_type(cls: Type) -> bool:
+    """Check whether instances of cls are dataclasses, once per type."""
+    return hasattr(cls, '__dataclass_fields__')
+
+
+@lru_cache(maxsize=None)
+def _optional_of(field_type: Any) -> Any:
+    """Get Optional[field_type], built once per type during class generation."""
+    return Union[field_type, type(None)]
+
+
+@lru_cache(maxsize=None)
+def _init_takes_fields_positionally(cls: Type) -> bool:
+    """
+    Check whether cls.__init__ takes exactly cls's fields as positional parameters, in order.
+
+    True for plain dataclass-generated __init__ methods. False for lazy classes,
+    whose tracking __init__ records the keyword names it is given, and for classes
+    with kw_only or init=False fields.
+    """
+    code = getattr(cls.__init__, '__code__', None)
+    if code is None:
+        return False
+    return code.co_varnames[1:code.co_argcount] == tuple(f.name for f in fields(cls))
+
+
+def _construct_from_field_values(cls: Type, field_values: List[Any]) -> Any:
+    """Instantiate dataclass cls from one value per field, in field order."""
+    if _init_takes_fields_positionally(cls):
+        # Positional call skips building and unpacking a kwargs dict
+        return cls(*field_values)
+    return cls(**{f.name: value for f, value in zip(_dataclass_fields(cls), field_values)})
+
+
+@lru_cache(maxsize=None)
+def _raw_field_values_getter(cls: Type) -> Callable[[Any], Tuple[Any, ...]]:
+    """
+    Get a function returning an instance's stored field values as a tuple, in field order.
+
+    Classes without a custom __getattribute__ read all fields with one attrgetter
+    call; lazy classes go through object.__getattribute__ per field so reading
+    never triggers resolution.
+    """
+    names = tuple(f.name for f in fields(cls))
+    if len(names) > 1 and cls.__getattribute__ is object.__getattribute__:
+        return attrgetter(*names)
+
+    def raw_field_values(obj, _raw_getattr=object.__getattribute__):
+        return tuple(_raw_getattr(obj, name) for name in names)
+    return raw_field_values
 
 
 # ContextEventCoordinator removed - replaced with contextvars-based context system
@@ -43,7 +152,23 @@ _lazy_class_cache: Dict[str, Type] = {}
 
 def register_lazy_type_mapping(lazy_type: Type, base_type: Type) -> None:
     """Register mapping between lazy dataclass type and its base type."""
+    previous_base_type = _lazy_type_registry.get(lazy_type)
     _lazy_type_registry[lazy_type] = base_type
+    if previous_base_type is not None and _base_to_lazy_type.get(previous_base_type) is lazy_type:
+        # Remapped: fall back to the next lazy type registered for the old base, if any
+        del _base_to_lazy_type[previous_base_type]
+        for other_lazy_type, other_base_type in _lazy_type_registry.items():
+            if other_base_type is previous_base_type:
+                _base_to_lazy_type[previous_base_type] = other_lazy_type
+                break
+    _base_to_lazy_type.setdefault(base_type, lazy_type)
+    # Also stored on the lazy class itself for lookups that already hold the type
+    lazy_type._base_type = base_type
+
+    # Compatibility results and class-default placeholders depend on the registry
+    from hieraconf.context_manager import _is_compatible_type_pair
+    _is_compatible_type_pair.cache_clear()
+    _class_default_placeholders.clear()
 
 
 def get_base_type_for_lazy(lazy_type: Type) -> Optional[Type]:
@@ -107,115 +232,110 @@ class LazyMethodBindings:
     def create_resolver() -> Callable[[Any, str], Any]:
         """Create field resolver method using new pure function interface."""
         from hieraconf.dual_axis_resolver import resolve_field_inheritance
-        from hieraconf.context_manager import current_temp_global, extract_all_configs
+        from hieraconf.context_manager import current_temp_global, _extract_all_configs_cached
 
         def _resolve_field_value(self, field_name: str) -> Any:
             # Get current context from contextvars
-            try:
-                current_context = current_temp_global.get()
-                # Extract available configs from current context
-                available_configs = extract_all_configs(current_context)
-
-                # Use pure function for resolution
-                return resolve_field_inheritance(self, field_name, available_configs)
-            except LookupError:
+            current_context = current_temp_global.get(_NO_CONTEXT)
+            if current_context is _NO_CONTEXT:
                 # No context available - return None (fail-loud approach)
-                logger.debug(f"No context available for resolving {type(self).__name__}.{field_name}")
+                logger.debug("No context available for resolving %s.%s", type(self).__name__, field_name)
                 return None
 
+            # Extract available configs from current context
+            available_configs = _extract_all_configs_cached(current_context)
+
+            # Use pure function for resolution
+            return resolve_field_inheritance(self, field_name, available_configs)
+
         return _resolve_field_value
 
     @staticmethod
-    def create_getattribute() -> Callable[[Any, str], Any]:
-        """Create lazy __getattribute__ method using new context system."""
-        from hieraconf.dual_axis_resolver import resolve_field_inheritance, _has_concrete_field_override
-        from hieraconf.context_manager import current_temp_global, extract_all_configs
-
-        def _find_mro_concrete_value(base_class, name):
-            """Extract common MRO traversal pattern."""
-            return next((getattr(cls, name) for cls in base_class.__mro__
-                        if _has_concrete_field_override(cls, name)), None)
+    def create_getattribute(base_class: Type) -> Callable[[Any, str], Any]:
+        """Create lazy __getattribute__ method using new context system, bound to base_class."""
+        from hieraconf.dual_axis_resolver import resolve_field_inheritance, _mro_concrete_value
+        from hieraconf.context_manager import current_temp_global, _extract_all_configs_cached
 
         def _try_global_context_value(self, base_class, name):
             """Extract global context resolution logic using new pure function interface."""
             if not hasattr(self, '_global_config_type'):
                 return None
 
-            # Get current context from contextvars
-            try:
-                current_context = current_temp_global.get()
+            # Get current context from contextvars; without one, fall back to MRO
+            current_context = current_temp_global.get(_NO_CONTEXT)
+            if current_context is not _NO_CONTEXT:
                 # Extract available configs from current context
-                available_configs = extract_all_configs(current_context)
+                available_configs = _extract_all_configs_cached(current_context)
 
                 # Use pure function for resolution
                 resolved_value = resolve_field_inheritance(self, name, available_configs)
                 if resolved_value is not None:
                     return resolved_value
-            except LookupError:
-                # No context available - fall back to MRO
-                pass
 
             # Fallback to MRO concrete value
-            return _find_mro_concrete_value(base_class, name)
+            return _mro_concrete_value(base_class, name)
 
-        def __getattribute__(self: Any, name: str) -> Any:
+        def __getattribute__(self: Any, name: str, _raw_getattr=object.__getattribute__,
+                             _field_map_for=_lazy_field_map) -> Any:
             """
             Three-stage resolution using new context system.
 
             Stage 1: Check instance value
             Stage 2: Simple field path lookup in current scope's merged config
             Stage 3: Inheritance resolution using same merged context
+
+            Stage 1 helpers are bound as default arguments so every attribute
+            access reads them as fast locals.
             """
-            # Stage 1: Get instance value
-            value = object.__getattribute__(self, name)
-            if value is not None or name not in {f.name for f in fields(self.__class__)}:
+            # Stage 1: Get instance value. Concrete values, methods, dunders and
+            # other non-field attributes return here without touching the context
+            value = _raw_getattr(self, name)
+            if value is not None:
+                return value
+            field_map = _field_map_for(type(self))
+            if name not in field_map:
                 return value
 
+            # Stages 2 and 3 share the current merged context
+            current_context = current_temp_global.get(_NO_CONTEXT)
+            if current_context is _NO_CONTEXT:
+                # No context available - fallback to MRO concrete values
+                return _mro_concrete_value(base_class, name)
+
             # Stage 2: Simple field path lookup in current scope's merged global
-            try:
-                current_context = current_temp_global.get()
-                if current_context is not None:
-                    # Get the config type name for this lazy class
-                    config_field_name = getattr(self, '_config_field_name', None)
-                    if config_field_name:
-                        try:
-                            config_instance = getattr(current_context, config_field_name)
-                            if config_instance is not None:
-                                resolved_value = getattr(config_instance, name)
-                                if resolved_value is not None:
-                                    return resolved_value
-                        except AttributeError:
-                            # Field doesn't exist in merged config, continue to inheritance
-                            pass
-            except LookupError:
-                # No context available, continue to inheritance
-                pass
+            # (skipped when the merged config's type can't have the field)
+            # Get the config type name for this lazy class
+            config_field_name = getattr(type(self), '_config_field_name', None)
+            if (current_context is not None and config_field_name
+                    and _may_have_attribute(type(current_context), config_field_name)):
+                config_instance = getattr(current_context, config_field_name, None)
+                if config_instance is not None:
+                    resolved_value = getattr(config_instance, name, None)
+                    if resolved_value is not None:
+                        return resolved_value
 
             # Stage 3: Inheritance resolution using same merged context
-            try:
-                current_context = current_temp_global.get()
-                available_configs = extract_all_configs(current_context)
-                resolved_value = resolve_field_inheritance(self, name, available_configs)
-
-                if resolved_value is not None:
-                    return resolved_value
+            available_configs = _extract_all_configs_cached(current_context)
+            resolved_value = resolve_field_inheritance(self, name, available_configs)
 
-                # For nested dataclass fields, return lazy instance
-                field_obj = next((f for f in fields(self.__class__) if f.name == name), None)
-                if field_obj and is_dataclass(field_obj.type):
-                    return field_obj.type()
+            if resolved_value is not None:
+                return resolved_value
 
-                return None
+            # For nested dataclass fields, return lazy instance
+            field_obj = field_map[name]
+            if is_dataclass(field_obj.type):
+                return field_obj.type()
 
-            except LookupError:
-                # No context available - fallback to MRO concrete values
-                return _find_mro_concrete_value(get_base_type_for_lazy(self.__class__), name)
+            return None
         return __getattribute__
 
     @staticmethod
     def create_to_base_config(base_class: Type) -> Callable[[Any], Any]:
         """Create base config converter method."""
-        def to_base_config(self):
+        # base_class only accepts its own fields, so its field names are fixed here
+        field_names = tuple(f.name for f in fields(base_class))
+
+        def to_base_config(self, _names=field_names, _raw_getattr=object.__getattribute__):
             # CRITICAL FIX: Use object.__getattribute__ to preserve raw None values
             # getattr() triggers lazy resolution, converting None to static defaults
             # None values must be preserved for dual-axis inheritance to work correctly
@@ -225,7 +345,7 @@ class LazyMethodBindings:
             # causing resolution to use the wrong/stale context and losing the GlobalPipelineConfig base.
             # We must extract raw None values here, let config_context() merge them into the hierarchy,
             # and THEN resolution happens later with the properly built context.
-            field_values = {f.name: object.__getattribute__(self, f.name) for f in fields(self)}
+            field_values = {name: _raw_getattr(self, name) for name in _names}
             return base_class(**field_values)
         return to_base_config
 
@@ -275,11 +395,11 @@ class LazyDataclassFactory:
                     lazy_class_name=f"Lazy{field.type.__name__}"
                 )
                 field_type = lazy_nested_type
-                logger.debug(f"Created lazy class for {field.name}: {field.type} -> {lazy_nested_type}")
+                logger.debug("Created lazy class for %s: %s -> %s", field.name, field.type, lazy_nested_type)
 
             # Complex type logic: make Optional if no default, preserve existing Optional types
             if is_already_optional or not has_default:
-                final_field_type = Union[field_type, type(None)] if not is_already_optional else field_type
+                final_field_type = _optional_of(field_type) if not is_already_optional else field_type
             else:
                 final_field_type = field_type
 
@@ -340,9 +460,10 @@ class LazyDataclassFactory:
             raise ValueError(f"{base_class} must be a dataclass")
 
         # Check cache first to prevent duplicate creation
-        cache_key = f"{base_class.__name__}_{lazy_class_name}_{id(instance_provider)}"
-        if cache_key in _lazy_class_cache:
-            return _lazy_class_cache[cache_key]
+        cache_key = (base_class, lazy_class_name)
+        cached_class = _lazy_class_cache.get(cache_key)
+        if cached_class is not None:
+            return cached_class
 
         # ResolutionConfig system removed - dual-axis resolver handles all resolution
 
@@ -353,8 +474,8 @@ class LazyDataclassFactory:
         base_metaclass = type(base_class)
         has_inherit_as_none_marker = hasattr(base_class, '_inherit_as_none') and base_class._inherit_as_none
         has_unsafe_metaclass = (
-            (hasattr(base_class, '__metaclass__') or base_metaclass != type) and
-            base_metaclass != InheritAsNoneMeta and
+            (hasattr(base_class, '__metaclass__') or base_metaclass is not type) and
+            base_metaclass is not InheritAsNoneMeta and
             not has_inherit_as_none_marker
         )
 
@@ -383,20 +504,25 @@ class LazyDataclassFactory:
                 frozen=base_is_frozen  # Match base class frozen state
             )
 
-        # Add constructor parameter tracking to detect user-set fields
+        # Per-class resolution constants; instances read them through the class
+        # Store the global config type for inheritance resolution
+        lazy_class._global_config_type = global_config_type
+        # Store the config field name for simple field path lookup
+        # (interned: it is built at runtime and used for getattr on every stage 2 lookup)
+        lazy_class._config_field_name = sys.intern(_camel_to_snake(base_class.__name__))
+
+        # Add constructor parameter tracking to detect user-set fields.
+        # Only the names are recorded per instance; the set is built on first access
+        lazy_class._explicitly_set_field_names = ()
+        explicitly_set_fields = cached_property(_explicitly_set_fields)
+        explicitly_set_fields.__set_name__(lazy_class, '_explicitly_set_fields')
+        lazy_class._explicitly_set_fields = explicitly_set_fields
+
         original_init = lazy_class.__init__
         def __init_with_tracking__(self, **kwargs):
             # Track which fields were explicitly passed to constructor
-            object.__setattr__(self, '_explicitly_set_fields', set(kwargs.keys()))
-            # Store the global config type for inheritance resolution
-            object.__setattr__(self, '_global_config_type', global_config_type)
-            # Store the config field name for simple field path lookup
-            import re
-            def _camel_to_snake_local(name: str) -> str:
-                s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-                return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
-            config_field_name = _camel_to_snake_local(base_class.__name__)
-            object.__setattr__(self, '_config_field_name', config_field_name)
+            if kwargs:
+                object.__setattr__(self, '_explicitly_set_field_names', tuple(kwargs))
             original_init(self, **kwargs)
 
         lazy_class.__init__ = __init_with_tracking__
@@ -404,7 +530,7 @@ class LazyDataclassFactory:
         # Bind methods declaratively - inline single-use method
         method_bindings = {
             RESOLVE_FIELD_VALUE_METHOD: LazyMethodBindings.create_resolver(),
-            GET_ATTRIBUTE_METHOD: LazyMethodBindings.create_getattribute(),
+            GET_ATTRIBUTE_METHOD: LazyMethodBindings.create_getattribute(base_class),
             TO_BASE_CONFIG_METHOD: LazyMethodBindings.create_to_base_config(base_class),
             **LazyMethodBindings.create_class_methods()
         }
@@ -449,6 +575,11 @@ class LazyDataclassFactory:
         # Generate class name if not provided
         lazy_class_name = lazy_class_name or f"Lazy{base_class.__name__}"
 
+        # Reuse an existing lazy class without building the provider closure
+        cached_class = _lazy_class_cache.get((base_class, lazy_class_name))
+        if cached_class is not None:
+            return cached_class
+
         # Simple provider that uses new contextvars system
         def simple_provider():
             """Simple provider using new contextvars system."""
@@ -516,11 +647,38 @@ def _detect_context_type(obj: Any) -> Optional[str]:
         return "function"
 
     # Check if object is an instance of any registered context provider
-    for context_type, provider_class in CONTEXT_PROVIDERS.items():
-        if isinstance(obj, provider_class):
-            return context_type
+    return _provider_context_type(type(obj))
+
+
+# Provider context type per class, built against _provider_context_types_size providers
+_provider_context_types: Dict[Type, Optional[str]] = {}
+_provider_context_types_size = 0
 
-    return None
+
+def _provider_context_type(obj_type: Type) -> Optional[str]:
+    """
+    Get the context type of the first registered provider obj_type subclasses, or None.
+
+    The answer depends only on the class, so it is cached per type and rebuilt
+    when providers are registered.
+    """
+    global _provider_context_types_size
+    if _provider_context_types_size != len(CONTEXT_PROVIDERS):
+        _provider_context_types.clear()
+        _provider_context_types_size = len(CONTEXT_PROVIDERS)
+
+    try:
+        return _provider_context_types[obj_type]
+    except KeyError:
+        pass
+
+    matched_context_type = None
+    for context_type, provider_class in CONTEXT_PROVIDERS.items():
+        if issubclass(obj_type, provider_class):
+            matched_context_type = context_type
+            break
+    _provider_context_types[obj_type] = matched_context_type
+    return matched_context_type
 
 
 # ContextInjector removed - replaced with contextvars-based context system
@@ -528,6 +686,10 @@ def _detect_context_type(obj: Any) -> Optional[str]:
 
 
 
+# Leaf types resolve_hieraconfurations_for_serialization returns as-is
+_PRIMITIVE_TYPES = frozenset({int, float, str, bool, type(None), bytes})
+
+
 def resolve_hieraconfurations_for_serialization(data: Any) -> Any:
     """
     Recursively resolve lazy dataclass instances to concrete values for serialization.
@@ -545,17 +707,22 @@ def resolve_hieraconfurations_for_serialization(data: Any) -> Any:
             # Lazy resolution happens here via context
             resolved_steps = resolve_hieraconfurations_for_serialization(steps)
     """
+    # Primitive leaves are by far the most common values; return them untouched
+    data_type = type(data)
+    if data_type in _PRIMITIVE_TYPES:
+        return data
+
     # Check if this is a lazy dataclass
-    base_type = get_base_type_for_lazy(type(data))
+    base_type = get_base_type_for_lazy(data_type)
     if base_type is not None:
         # This is a lazy dataclass - resolve fields using getattr() within the active context
         # getattr() triggers lazy __getattribute__ which uses config_context() for resolution
         resolved_fields = {}
-        for f in fields(data):
+        for field_name in _lazy_field_map(type(data)):
             # CRITICAL: Use getattr() to trigger lazy resolution via context
             # The active config_context() provides the hierarchy for resolution
-            resolved_value = getattr(data, f.name)
-            resolved_fields[f.name] = resolved_value
+            resolved_value = getattr(data, field_name)
+            resolved_fields[field_name] = resolved_value
 
         # Create base config instance with resolved values
         resolved_data = base_type(**resolved_fields)
@@ -566,75 +733,69 @@ def resolve_hieraconfurations_for_serialization(data: Any) -> Any:
     # CRITICAL FIX: Handle step objects (non-dataclass objects with dataclass attributes)
     step_context_type = _detect_context_type(resolved_data)
     if step_context_type:
-        # This is a context object - inject it for its dataclass attributes
-        import inspect
-        frame = inspect.currentframe()
-        context_var_name = f"__{step_context_type}_context__"
-        frame.f_locals[context_var_name] = resolved_data
-        logger.debug(f"Injected {context_var_name} = {type(resolved_data).__name__}")
-
-        try:
-            # Process step attributes recursively
-            resolved_attrs = {}
+        # This is a context object - resolve its dataclass attributes
+        resolved_type_name = type(resolved_data).__name__
+
+        # Process step attributes recursively
+        resolved_attrs = {}
+        instance_attrs = getattr(resolved_data, '__dict__', None)
+        if instance_attrs is None:
+            # No instance dict (e.g. __slots__) - fall back to scanning dir()
+            instance_attrs = {}
             for attr_name in dir(resolved_data):
                 if attr_name.startswith('_'):
                     continue
                 try:
-                    attr_value = getattr(resolved_data, attr_name)
-                    if not callable(attr_value):  # Skip methods
-                        logger.debug(f"Resolving {type(resolved_data).__name__}.{attr_name} = {type(attr_value).__name__}")
-                        resolved_attrs[attr_name] = resolve_hieraconfurations_for_serialization(attr_value)
-                except (AttributeError, Exception):
+                    instance_attrs[attr_name] = getattr(resolved_data, attr_name)
+                except Exception:
                     continue
 
-            # Handle function objects specially - they can't be recreated with __new__
-            if step_context_type == "function":
-                # For functions, just process attributes for resolution but return original function
-                # The resolved config values will be stored in func plan by compiler
-                return resolved_data
-
-            # Create new step object with resolved attributes
-            # CRITICAL FIX: Copy all original attributes using __dict__ to preserve everything
-            new_step = type(resolved_data).__new__(type(resolved_data))
-
-            # Copy all attributes from the original object's __dict__
-            if hasattr(resolved_data, '__dict__'):
-                new_step.__dict__.update(resolved_data.__dict__)
-
-            # Update with resolved config attributes (these override the originals)
-            for attr_name, attr_value in resolved_attrs.items():
-                setattr(new_step, attr_name, attr_value)
-            return new_step
-        finally:
-            if context_var_name in frame.f_locals:
-                del frame.f_locals[context_var_name]
-            del frame
+        # Only instance attributes are copied onto the new step below, so the
+        # inherited methods and dunders dir() would list are never needed
+        for attr_name, attr_value in instance_attrs.items():
+            if attr_name.startswith('_') or callable(attr_value):  # Skip private attrs and methods
+                continue
+            try:
+                logger.debug("Resolving %s.%s = %s", resolved_type_name, attr_name, type(attr_value).__name__)
+                resolved_attrs[attr_name] = resolve_hieraconfurations_for_serialization(attr_value)
+            except Exception:
+                continue
+
+        # Handle function objects specially - they can't be recreated with __new__
+        if step_context_type == "function":
+            # For functions, just process attributes for resolution but return original function
+            # The resolved config values will be stored in func plan by compiler
+            return resolved_data
+
+        # Create new step object with resolved attributes
+        # CRITICAL FIX: Copy all original attributes using __dict__ to preserve everything
+        new_step = type(resolved_data).__new__(type(resolved_data))
+
+        # Copy all attributes from the original object's __dict__
+        if hasattr(resolved_data, '__dict__'):
+            new_step.__dict__.update(resolved_data.__dict__)
+
+        # Update with resolved config attributes (these override the originals)
+        for attr_name, attr_value in resolved_attrs.items():
+            setattr(new_step, attr_name, attr_value)
+        return new_step
 
     # Recursively process nested structures based on type
     elif is_dataclass(resolved_data) and not isinstance(resolved_data, type):
         # Process dataclass fields recursively - inline field processing pattern
-        # CRITICAL FIX: Inject parent object as context for sibling config inheritance
-        context_type = _detect_context_type(resolved_data) or "dataclass"  # Default to "dataclass" for generic dataclasses
-        import inspect
-        frame = inspect.currentframe()
-        context_var_name = f"__{context_type}_context__"
-        frame.f_locals[context_var_name] = resolved_data
-        logger.debug(f"Injected {context_var_name} = {type(resolved_data).__name__}")
+        resolved_type_name = type(resolved_data).__name__
 
         # Add debug to see which fields are being resolved
-        logger.debug(f"Resolving fields for {type(resolved_data).__name__}: {[f.name for f in fields(resolved_data)]}")
+        dataclass_fields = fields(resolved_data)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Resolving fields for %s: %s", resolved_type_name, [f.name for f in dataclass_fields])
 
-        try:
-            resolved_fields = {}
-            for f in fields(resolved_data):
-                field_value = getattr(resolved_data, f.name)
-                logger.debug(f"Resolving {type(resolved_data).__name__}.{f.name} = {type(field_value).__name__}")
-                resolved_fields[f.name] = resolve_hieraconfurations_for_serialization(field_value)
-            return type(resolved_data)(**resolved_fields)
-        finally:
-            if context_var_name in frame.f_locals:
-                del frame.f_locals[context_var_name]
-            del frame
+        resolved_fields = {}
+        for f in dataclass_fields:
+            field_value = getattr(resolved_data, f.name)
+            logger.debug("Resolving %s.%s = %s", resolved_type_name, f.name, type(field_value).__name__)
+            resolved_fields[f.name] = resolve_hieraconfurations_for_serialization(field_value)
+        return type(resolved_data)(**resolved_fields)
 
     elif isinstance(resolved_data, dict):
         # Process dictionary values recursively
@@ -667,15 +828,14 @@ def create_dataclass_for_editing(dataclass_type: Type[T], source_config: Any, pr
         context_provider(source_config)
 
     # Mathematical simplification: Convert verbose loop to unified comprehension
-    from hieraconf.placeholder import LazyDefaultPlaceholderService
-    field_values = {
-        f.name: (getattr(source_config, f.name) if preserve_values
-                else f.type() if is_dataclass(f.type) and LazyDefaultPlaceholderService.has_lazy_resolution(f.type)
-                else None)
-        for f in fields(dataclass_type)
-    }
+    field_values = [
+        (getattr(source_config, f.name) if preserve_values
+         else f.type() if is_dataclass(f.type) and LazyDefaultPlaceholderService.has_lazy_resolution(f.type)
+         else None)
+        for f in _dataclass_fields(dataclass_type)
+    ]
 
-    return dataclass_type(**field_values)
+    return _construct_from_field_values(dataclass_type, field_values)
 
 
 
@@ -701,7 +861,9 @@ def rebuild_hieraconf_with_new_global_reference(
         global_config_type: Type of the global config (defaults to type of new_global_config)
 
     Returns:
-        New lazy config instance with preserved field states and updated global reference
+        Lazy config instance with preserved field states and updated global reference.
+        Lazy configs resolve through the context rather than holding the global config,
+        so a config none of whose nested configs changed is returned as-is.
     """
     if existing_hieraconf is None:
         return None
@@ -713,47 +875,82 @@ def rebuild_hieraconf_with_new_global_reference(
     # Set new global config in thread-local storage
     ensure_global_config_context(global_config_type, new_global_config)
 
-    # Extract current field values without triggering lazy resolution - inline field processing pattern
-    def process_field_value(field_obj):
-        raw_value = object.__getattribute__(existing_hieraconf, field_obj.name)
-
-        if raw_value is not None and hasattr(raw_value, '__dataclass_fields__'):
-            try:
-                # Check if this is a concrete dataclass that should be converted to lazy
-                is_lazy = LazyDefaultPlaceholderService.has_lazy_resolution(type(raw_value))
-
-                if not is_lazy:
-                    lazy_type = LazyDefaultPlaceholderService._get_lazy_type_for_base(type(raw_value))
-
-                    if lazy_type:
-                        # Convert concrete dataclass to lazy version while preserving ONLY non-default field values
-                        # This allows fields that match class defaults to inherit from context
-                        concrete_field_values = {}
-                        for f in fields(raw_value):
-                            field_value = object.__getattribute__(raw_value, f.name)
-
-                            # Get the class default for this field
-                            class_default = getattr(type(raw_value), f.name, None)
-
-                            # Only preserve values that differ from class defaults
-                            # This allows default values to be inherited from context
-                            if field_value != class_default:
-                                concrete_field_values[f.name] = field_value
-
-                        logger.debug(f"Converting concrete {type(raw_value).__name__} to lazy version {lazy_type.__name__} for placeholder resolution")
-                        return lazy_type(**concrete_field_values)
+    def convert_concrete_config(raw_value,
+                                _has_lazy_resolution=LazyDefaultPlaceholderService.has_lazy_resolution,
+                                _lazy_type_for_base=LazyDefaultPlaceholderService._get_lazy_type_for_base):
+        """Convert a concrete config with a registered lazy version, or return None."""
+        # Check if this is a concrete dataclass that should be converted to lazy
+        raw_type = type(raw_value)
+        if _has_lazy_resolution(raw_type):
+            return None
+        lazy_type = _lazy_type_for_base(raw_type)
+        if not lazy_type:
+            return None
+
+        # Convert concrete dataclass to lazy version while preserving ONLY non-default field values
+        # This allows fields that match class defaults to inherit from context
+        concrete_field_values = {}
+        for (field_name, class_default), field_value in zip(
+            _field_class_defaults(raw_type), _raw_field_values_getter(raw_type)(raw_value)
+        ):
+            # Only preserve values that differ from class defaults
+            # This allows default values to be inherited from context; the
+            # identity check skips __eq__ for untouched class-level defaults
+            if field_value is not class_default and field_value != class_default:
+                concrete_field_values[field_name] = field_value
+
+        logger.debug("Converting concrete %s to lazy version %s for placeholder resolution", raw_type.__name__, lazy_type.__name__)
+        return lazy_type(**concrete_field_values)
+
+    # Iterative post-order walk over nested configs: a config is rebuilt once all
+    # of its nested config fields have been. Results are keyed by id() so a config
+    # shared between fields is rebuilt once; nested failures keep the original value.
+    rebuilt: Dict[int, Any] = {}
+    in_progress = {id(existing_hieraconf)}
+    # Entries are [config, field name in parent, raw field values once read]
+    stack = [[existing_hieraconf, None, None]]
+    while stack:
+        entry = stack[-1]
+        node, field_name, raw_values = entry
+        try:
+            if raw_values is None:
+                # Extract current field values without triggering lazy resolution,
+                # then schedule nested configs ahead of this one
+                entry[2] = raw_values = _raw_field_values_getter(type(node))(node)
+                for f, raw_value in zip(_dataclass_fields(type(node)), raw_values):
+                    raw_id = id(raw_value)
+                    if (raw_value is None or raw_id in rebuilt or raw_id in in_progress
+                            or not _is_dataclass_type(type(raw_value))):
+                        continue
+                    try:
+                        converted = convert_concrete_config(raw_value)
+                    except Exception as e:
+                        logger.debug("Failed to rebuild nested config %s: %s", f.name, e)
+                        converted = raw_value
+                    if converted is not None:
+                        rebuilt[raw_id] = converted
+                    else:
+                        # If already lazy or no lazy version available, rebuild its fields too
+                        in_progress.add(raw_id)
+                        stack.append([raw_value, f.name, None])
+                if stack[-1] is not entry:
+                    continue
 
-                # If already lazy or no lazy version available, rebuild recursively
-                nested_result = rebuild_hieraconf_with_new_global_reference(raw_value, new_global_config, global_config_type)
-                return nested_result
-            except Exception as e:
-                logger.debug(f"Failed to rebuild nested config {field_obj.name}: {e}")
-                return raw_value
-        return raw_value
+            current_field_values = [rebuilt.get(id(raw_value), raw_value) for raw_value in raw_values]
+            changed = any(field_value is not raw_value for field_value, raw_value in zip(current_field_values, raw_values))
+            # Share unchanged configs instead of constructing an identical copy
+            result = _construct_from_field_values(type(node), current_field_values) if changed else node
+        except Exception as e:
+            if node is existing_hieraconf:
+                raise
+            logger.debug("Failed to rebuild nested config %s: %s", field_name, e)
+            result = node
 
-    current_field_values = {f.name: process_field_value(f) for f in fields(existing_hieraconf)}
+        stack.pop()
+        in_progress.discard(id(node))
+        rebuilt[id(node)] = result
 
-    return type(existing_hieraconf)(**current_field_values)
+    return rebuilt[id(existing_hieraconf)]
 
 
 # Declarative Global Config Field Injection System
@@ -764,8 +961,70 @@ GLOBAL_CONFIG_PREFIX = "Global"
 LAZY_CONFIG_PREFIX = "Lazy"
 
 # Registry to accumulate all decorations before injection
-_pending_injections = {}
+_pending_injections: Dict[Type, Dict[str, Any]] = {}
+# Set when a config is queued for injection, cleared by _inject_all_pending_fields
+_pending_dirty = False
+
+
+
+def _base_field_annotations(bases: Tuple[Type, ...]) -> Dict[str, Tuple[Type, Any]]:
+    """
+    Map each field annotated directly on one of bases to (declaring base, annotation).
+
+    When several bases annotate the same field, the first one in bases wins.
+    Computed per call rather than cached: inherit_as_none processing rewrites
+    class attributes and annotations after classes are created.
+    """
+    base_annotations = {}
+    for base in bases:
+        for field_name, field_type in getattr(base, '__annotations__', {}).items():
+            base_annotations.setdefault(field_name, (base, field_type))
+    return base_annotations
+
+
+def _set_inherited_fields_to_none(cls: Type, bases: Tuple[Type, ...], explicitly_defined_fields: Set[str],
+                                  only_concrete_parent_defaults: bool = False) -> Set[str]:
+    """
+    Override fields inherited from bases with None class defaults (inherit_as_none).
+
+    Shared by InheritAsNoneMeta, which runs before @dataclass and only overrides
+    parent fields with a concrete default, and the global default decorator,
+    which overrides every inherited field that is not explicitly defined.
+
+    Returns:
+        Names of the fields set to None
+    """
+    fields_set_to_none = set()
+    for field_name, (base, field_type) in _base_field_annotations(bases).items():
+        if field_name in explicitly_defined_fields:
+            continue
+        # A missing parent attribute counts as a None default
+        if only_concrete_parent_defaults and getattr(base, field_name, None) is None:
+            continue
 
+        # CRITICAL: Force the field to be seen as locally defined by @dataclass
+        # 1. Set the class attribute to None
+        setattr(cls, field_name, None)
+        fields_set_to_none.add(field_name)
+
+        # 2. Ensure annotation exists in THIS class
+        if not hasattr(cls, '__annotations__'):
+            cls.__annotations__ = {}
+        cls.__annotations__[field_name] = field_type
+    if fields_set_to_none:
+        _clear_class_default_caches()
+    return fields_set_to_none
+
+
+def _clear_class_default_caches() -> None:
+    """Drop memoized class-level field lookups after class defaults are rewritten."""
+    from hieraconf.dual_axis_resolver import _has_concrete_field_override, _mro_concrete_value
+    _has_concrete_field_override.cache_clear()
+    _mro_concrete_value.cache_clear()
+
+
+# Pickle-safe class namespaces built by InheritAsNoneMeta.__reduce__, per class
+_reduce_safe_namespaces: 'weakref.WeakKeyDictionary[Type, Dict[str, Any]]' = weakref.WeakKeyDictionary()
 
 
 class InheritAsNoneMeta(ABCMeta):
@@ -781,7 +1040,7 @@ class InheritAsNoneMeta(ABCMeta):
         cls = super().__new__(mcs, name, bases, namespace)
 
         # Check if this class should have inherit_as_none applied
-        if hasattr(cls, '_inherit_as_none') and cls._inherit_as_none:
+        if getattr(cls, '_inherit_as_none', False):
             # Add multiprocessing safety marker
             cls._multiprocessing_safe = True
             # Get explicitly defined fields (in this class's namespace)
@@ -792,49 +1051,29 @@ class InheritAsNoneMeta(ABCMeta):
                         explicitly_defined_fields.add(field_name)
 
             # Process parent classes to find fields that need None overrides
-            processed_fields = set()
-            for base in bases:
-                if hasattr(base, '__annotations__'):
-                    for field_name, field_type in base.__annotations__.items():
-                        if field_name in processed_fields:
-                            continue
-
-                        # Check if parent has concrete default
-                        parent_has_concrete_default = False
-                        if hasattr(base, field_name):
-                            parent_value = getattr(base, field_name)
-                            parent_has_concrete_default = parent_value is not None
-
-                        # Add None override if needed
-                        if (field_name not in explicitly_defined_fields and parent_has_concrete_default):
-                            # Set the class attribute to None
-                            setattr(cls, field_name, None)
-
-                            # Ensure annotation exists
-                            if not hasattr(cls, '__annotations__'):
-                                cls.__annotations__ = {}
-                            cls.__annotations__[field_name] = field_type
-
-                            processed_fields.add(field_name)
-                        else:
-                            processed_fields.add(field_name)
+            _set_inherited_fields_to_none(cls, bases, explicitly_defined_fields, only_concrete_parent_defaults=True)
 
         return cls
 
     def __reduce__(cls):
         """Make classes with this metaclass pickle-safe for multiprocessing."""
-        # Filter out problematic descriptors that cause conflicts during pickle/unpickle
-        safe_dict = {}
-        for key, value in cls.__dict__.items():
-            # Skip descriptors that cause conflicts
-            if hasattr(value, '__get__') and hasattr(value, '__set__'):
-                continue  # Skip data descriptors
-            if hasattr(value, '__dict__') and hasattr(value, '__class__'):
-                # Skip complex objects that might have descriptor conflicts
-                if 'descriptor' in str(type(value)).lower():
-                    continue
-            # Include safe attributes
-            safe_dict[key] = value
+        # The filtered namespace is computed on first use; class namespaces are
+        # complete once decoration (and inherit_as_none post-processing) finishes
+        safe_dict = _reduce_safe_namespaces.get(cls)
+        if safe_dict is None:
+            # Filter out problematic descriptors that cause conflicts during pickle/unpickle
+            safe_dict = {}
+            for key, value in cls.__dict__.items():
+                # Skip descriptors that cause conflicts
+                if hasattr(value, '__get__') and hasattr(value, '__set__'):
+                    continue  # Skip data descriptors
+                if hasattr(value, '__dict__') and hasattr(value, '__class__'):
+                    # Skip complex objects that might have descriptor conflicts
+                    if 'descriptor' in str(type(value)).lower():
+                        continue
+                # Include safe attributes
+                safe_dict[key] = value
+            _reduce_safe_namespaces[cls] = safe_dict
 
         # Return reconstruction using the base type (not the metaclass)
         return (type, (cls.__name__, cls.__bases__, safe_dict))
@@ -847,11 +1086,19 @@ def create_global_default_decorator(target_config_class: Type):
     The decorator accumulates all decorations, then injects all fields at once
     when the module finishes loading. Also creates lazy versions of all decorated configs.
     """
-    target_class_name = target_config_class.__name__
-    if target_class_name not in _pending_injections:
-        _pending_injections[target_class_name] = {
+    # Keyed by the class itself so same-named targets in different modules stay separate
+    if target_config_class not in _pending_injections:
+        _pending_injections[target_config_class] = {
             'target_class': target_config_class,
-            'configs_to_inject': []
+            # Parallel per-config lists (one entry per decorated config class)
+            'configs_to_inject': {
+                'config_classes': [],
+                'field_names': [],
+                'lazy_class_names': [],
+                'optional_flags': [],
+                'inherit_as_none_flags': [],
+                'ui_hidden_flags': [],
+            }
         }
 
     def global_default_decorator(cls=None, *, optional: bool = False, inherit_as_none: bool = True, ui_hidden: bool = False):
@@ -865,6 +1112,7 @@ def create_global_default_decorator(target_config_class: Type):
             ui_hidden: Whether to hide from UI (apply decorator but don't inject into global config) (default: False)
         """
         def decorator(actual_cls):
+            global _pending_dirty
             # Apply inherit_as_none by modifying class BEFORE @dataclass (multiprocessing-safe)
             if inherit_as_none:
                 # Mark the class for inherit_as_none processing
@@ -883,29 +1131,10 @@ def create_global_default_decorator(target_config_class: Type):
                                 explicitly_defined_fields.add(field_name)
 
                 # Process parent classes to find fields that need None overrides
-                processed_fields = set()
-                fields_set_to_none = set()  # Track which fields were actually set to None
-                for base in actual_cls.__bases__:
-                    if hasattr(base, '__annotations__'):
-                        for field_name, field_type in base.__annotations__.items():
-                            if field_name in processed_fields:
-                                continue
-
-                            # Set inherited fields to None (except explicitly defined ones)
-                            if field_name not in explicitly_defined_fields:
-                                # CRITICAL: Force the field to be seen as locally defined by @dataclass
-                                # We need to ensure @dataclass processes this as a local field, not inherited
-
-                                # 1. Set the class attribute to None
-                                setattr(actual_cls, field_name, None)
-                                fields_set_to_none.add(field_name)
-
-                                # 2. Ensure annotation exists in THIS class
-                                if not hasattr(actual_cls, '__annotations__'):
-                                    actual_cls.__annotations__ = {}
-                                actual_cls.__annotations__[field_name] = field_type
-
-                            processed_fields.add(field_name)
+                # Track which fields were actually set to None
+                fields_set_to_none = _set_inherited_fields_to_none(
+                    actual_cls, actual_cls.__bases__, explicitly_defined_fields
+                )
 
                 # Note: We modify class attributes here, but we also need to fix the dataclass
                 # field definitions after @dataclass runs, since @dataclass processes the MRO
@@ -934,14 +1163,14 @@ def create_global_default_decorator(target_config_class: Type):
             # Skip injection for abstract classes (they can't be instantiated)
             # For concrete classes: inject even if ui_hidden (needed for lazy resolution context)
             if not is_abstract:
-                _pending_injections[target_class_name]['configs_to_inject'].append({
-                    'config_class': actual_cls,
-                    'field_name': field_name,
-                    'lazy_class_name': lazy_class_name,
-                    'optional': optional,  # Store the optional flag
-                    'inherit_as_none': inherit_as_none,  # Store the inherit_as_none flag
-                    'ui_hidden': ui_hidden  # Store the ui_hidden flag for field metadata
-                })
+                configs_to_inject = _pending_injections[target_config_class]['configs_to_inject']
+                configs_to_inject['config_classes'].append(actual_cls)
+                configs_to_inject['field_names'].append(field_name)
+                configs_to_inject['lazy_class_names'].append(lazy_class_name)
+                configs_to_inject['optional_flags'].append(optional)  # Store the optional flag
+                configs_to_inject['inherit_as_none_flags'].append(inherit_as_none)  # Store the inherit_as_none flag
+                configs_to_inject['ui_hidden_flags'].append(ui_hidden)  # Store the ui_hidden flag for field metadata
+                _pending_dirty = True
 
             # Immediately create lazy version of this config (not dependent on injection)
 
@@ -977,6 +1206,38 @@ def create_global_default_decorator(target_config_class: Type):
     return global_default_decorator
 
 
+def _set_init_defaults_to_none(cls: Type, init: Callable, field_names: set) -> bool:
+    """
+    Rewrite init's parameter defaults so the given fields default to None.
+
+    Only applies to an __init__ defined on cls itself (never one shared with a
+    parent) whose parameters for all field_names already have defaults; in that
+    case the defaults are swapped in place and True is returned. Otherwise
+    nothing is changed and False is returned.
+    """
+    code = getattr(init, '__code__', None)
+    if code is None or cls.__dict__.get('__init__') is not init:
+        return False
+
+    # Positional parameters after self; __defaults__ covers the trailing ones
+    positional = code.co_varnames[1:code.co_argcount]
+    defaults = list(init.__defaults__ or ())
+    first_default = len(positional) - len(defaults)
+    kwdefaults = dict(init.__kwdefaults__ or {})
+
+    for field_name in field_names:
+        if field_name in kwdefaults:
+            kwdefaults[field_name] = None
+        elif field_name in positional and positional.index(field_name) >= first_default:
+            defaults[positional.index(field_name) - first_default] = None
+        else:
+            return False
+
+    init.__defaults__ = tuple(defaults) if defaults else None
+    init.__kwdefaults__ = kwdefaults or None
+    return True
+
+
 def _fix_dataclass_field_defaults_post_processing(cls: Type, fields_set_to_none: set) -> None:
     """
     Fix dataclass field defaults after @dataclass has processed the class.
@@ -990,18 +1251,23 @@ def _fix_dataclass_field_defaults_post_processing(cls: Type, fields_set_to_none:
     # Store the original __init__ method
     original_init = cls.__init__
 
-    def custom_init(self, **kwargs):
-        """Custom __init__ that ensures inherited fields use None defaults."""
-        # For fields that should be None, set them to None if not explicitly provided
-        for field_name in fields_set_to_none:
-            if field_name not in kwargs:
-                kwargs[field_name] = None
+    # Prefer making None the real parameter default of the class's own generated
+    # __init__, so construction runs without an extra wrapper frame
+    if not _set_init_defaults_to_none(cls, original_init, fields_set_to_none):
+        none_default_fields = frozenset(fields_set_to_none)
 
-        # Call the original __init__ with modified kwargs
-        original_init(self, **kwargs)
+        def custom_init(self, **kwargs):
+            """Custom __init__ that ensures inherited fields use None defaults."""
+            # For fields that should be None, set them to None if not explicitly provided
+            missing_fields = none_default_fields - kwargs.keys()
+            if missing_fields:
+                kwargs.update(dict.fromkeys(missing_fields))
+
+            # Call the original __init__ with modified kwargs
+            original_init(self, **kwargs)
 
-    # Replace the __init__ method
-    cls.__init__ = custom_init
+        # Replace the __init__ method
+        cls.__init__ = custom_init
 
     # Also update the field defaults for consistency
     for field_name in fields_set_to_none:
@@ -1015,53 +1281,63 @@ def _fix_dataclass_field_defaults_post_processing(cls: Type, fields_set_to_none:
 
             # Also ensure the class attribute is None (should already be set, but double-check)
             setattr(cls, field_name, None)
-
-
+    _clear_class_default_caches()
 
 def _inject_all_pending_fields():
     """Inject all accumulated fields at once."""
-    for target_name, injection_data in _pending_injections.items():
+    global _pending_dirty
+    # Nothing decorated since the last injection: the targets are already up to date
+    if not _pending_dirty:
+        return
+    _pending_dirty = False
+
+    for injection_data in _pending_injections.values():
         target_class = injection_data['target_class']
         configs = injection_data['configs_to_inject']
 
-        if configs:  # Only inject if there are configs to inject
+        if configs['config_classes']:  # Only inject if there are configs to inject
             _inject_multiple_fields_into_dataclass(target_class, configs)
 
+_CAPITALIZED_WORD_RE = re.compile('(.)([A-Z][a-z]+)')
+_LOWER_UPPER_BOUNDARY_RE = re.compile('([a-z0-9])([A-Z])')
+
+
+@lru_cache(maxsize=512)
 def _camel_to_snake(name: str) -> str:
     """Convert CamelCase to snake_case for field names."""
-    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+    s1 = _CAPITALIZED_WORD_RE.sub(r'\1_\2', name)
+    return _LOWER_UPPER_BOUNDARY_RE.sub(r'\1_\2', s1).lower()
 
-def _inject_multiple_fields_into_dataclass(target_class: Type, configs: List[Dict]) -> None:
+def _inject_multiple_fields_into_dataclass(target_class: Type, configs: Dict[str, List]) -> None:
     """Mathematical simplification: Batch field injection with direct dataclass recreation."""
     # Imports moved to top-level
 
     # Direct field reconstruction - guaranteed by dataclass contract
     existing_fields = [
-        (f.name, f.type, field(default_factory=f.default_factory) if f.default_factory != MISSING
-         else f.default if f.default != MISSING else f.type)
+        (f.name, f.type, field(default_factory=f.default_factory) if f.default_factory is not MISSING
+         else f.default if f.default is not MISSING else f.type)
         for f in fields(target_class)
     ]
 
     # Mathematical simplification: Unified field construction with algebraic common factors
-    def create_field_definition(config):
+    def create_field_definition(field_name, field_type, is_optional, is_ui_hidden):
         """Create field definition with optional and inherit_as_none support."""
-        field_type = config['config_class']
-        is_optional = config.get('optional', False)
-        is_ui_hidden = config.get('ui_hidden', False)
-
         # Algebraic simplification: factor out common default_value logic
         if is_optional:
-            field_type = Union[field_type, type(None)]
+            field_type = _optional_of(field_type)
             default_value = None
         else:
             # Both inherit_as_none and regular cases use same default factory
             # Add ui_hidden metadata to the field so UI layer can check it
             default_value = field(default_factory=field_type, metadata={'ui_hidden': is_ui_hidden})
 
-        return (config['field_name'], field_type, default_value)
+        return (field_name, field_type, default_value)
 
-    all_fields = existing_fields + [create_field_definition(config) for config in configs]
+    all_fields = existing_fields + [
+        create_field_definition(*config)
+        for config in zip(configs['field_names'], configs['config_classes'],
+                          configs['optional_flags'], configs['ui_hidden_flags'])
+    ]
 
     # Direct dataclass recreation - fail-loud
     new_class = make_dataclass(
@@ -1084,18 +1360,18 @@ def _inject_multiple_fields_into_dataclass(target_class: Type, configs: List[Dic
     globals()[target_class.__name__] = new_class
 
     # Mathematical simplification: Extract common module assignment pattern
-    def _register_lazy_class(lazy_class, class_name, module_name):
+    def _register_lazy_class(lazy_class, class_name, config_module):
         """Register lazy class in both module and global namespace."""
-        setattr(sys.modules[module_name], class_name, lazy_class)
+        setattr(config_module, class_name, lazy_class)
         globals()[class_name] = lazy_class
 
     # Create lazy classes and recreate PipelineConfig inline
-    for config in configs:
+    for config_class, lazy_class_name in zip(configs['config_classes'], configs['lazy_class_names']):
         lazy_class = LazyDataclassFactory.make_lazy_simple(
-            base_class=config['config_class'],
-            lazy_class_name=config['lazy_class_name']
+            base_class=config_class,
+            lazy_class_name=lazy_class_name
         )
-        _register_lazy_class(lazy_class, config['lazy_class_name'], config['config_class'].__module__)
+        _register_lazy_class(lazy_class, lazy_class_name, sys.modules[config_class.__module__])
 
     # Create lazy version of the updated global config itself with proper naming
     # Global configs must start with GLOBAL_CONFIG_PREFIX - fail-loud if not
@@ -1111,7 +1387,7 @@ def _inject_multiple_fields_into_dataclass(target_class: Type, configs: List[Dic
     )
 
     # Use extracted helper for consistent registration
-    _register_lazy_class(lazy_global_class, lazy_global_class_name, target_class.__module__)
+    _register_lazy_class(lazy_global_class, lazy_global_class_name, module)
 
 
 
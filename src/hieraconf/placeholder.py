@@ -5,12 +5,166 @@ Provides placeholder text resolution for lazy configuration dataclasses
 using contextvars-based context management.
 """
 
-from typing import Any, Optional
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple, Union, get_args, get_origin
 import dataclasses
 import logging
+import sys
+
+from hieraconf.context_manager import current_temp_global
 
 logger = logging.getLogger(__name__)
 
+# Sentinel key for "no config context active"
+_NO_CONTEXT = object()
+
+# Sentinel for cache misses (None is a valid cached placeholder)
+_MISSING = object()
+
+# Default-constructed lazy instances used to resolve placeholders, for the most
+# recent context only: (context object, {lazy type: instance})
+_placeholder_instances: Tuple[Any, dict] = (_NO_CONTEXT, {})
+
+# Formatted class-default placeholders for types with no lazy version, keyed by
+# (type, field name, prefix). Cleared by register_lazy_type_mapping, since a newly
+# registered lazy version changes how its base type resolves
+_class_default_placeholders: Dict[Tuple[type, str, str], Optional[str]] = {}
+
+
+@lru_cache(maxsize=None)
+def _cached_field_names(cls) -> Tuple[str, ...]:
+    """Get the dataclass field names of cls, computed once per class for placeholder rendering."""
+    return tuple(f.name for f in dataclasses.fields(cls))
+
+
+@lru_cache(maxsize=None)
+def _enum_formatter() -> Callable[[Enum], str]:
+    """
+    Get the function used to display enum values in placeholders.
+
+    Resolved once, on first use: openhcs's UI formatter when available,
+    otherwise str. Deferred so importing hieraconf never imports the UI layer.
+    """
+    try:
+        # Optional UI integration - install openhcs for full functionality
+        from openhcs.ui.shared.ui_utils import format_enum_display
+    except ImportError:
+        return str
+    return format_enum_display
+
+
+@lru_cache(maxsize=32)
+def _prefix_formatter(prefix: Optional[str]) -> Callable[[str], str]:
+    """Get the function joining a placeholder prefix to value text, chosen once per prefix."""
+    if not prefix:
+        return lambda value_text: value_text
+    elif prefix.endswith(': '):
+        return lambda value_text: f"{prefix}{value_text}"
+    elif prefix.endswith(':'):
+        return lambda value_text: f"{prefix} {value_text}"
+    else:
+        return lambda value_text: f"{prefix}: {value_text}"
+
+
+@lru_cache(maxsize=None)
+def _class_default_map(cls) -> Dict[str, Any]:
+    """
+    Snapshot the class-level defaults of cls's dataclass fields, once per class.
+
+    Values are read with object.__getattribute__ on the class, as the placeholder
+    helpers always have (only the class's own namespace, no lazy resolution);
+    fields without a class attribute map to None. Empty for non-dataclasses.
+    """
+    defaults = {}
+    if dataclasses.is_dataclass(cls):
+        for field_name in _cached_field_names(cls):
+            try:
+                defaults[field_name] = object.__getattribute__(cls, field_name)
+            except AttributeError:
+                defaults[field_name] = None
+    return defaults
+
+
+def _intern_name(field_name: str) -> str:
+    """Intern field_name when it is an exact str; sys.intern rejects subclasses and non-str names."""
+    return sys.intern(field_name) if type(field_name) is str else field_name
+
+
+def _class_default(dataclass_type: type, field_name: str) -> Any:
+    """Get dataclass_type's class-level default for field_name, or None."""
+    defaults = _class_default_map(dataclass_type) if isinstance(dataclass_type, type) else {}
+    if field_name in defaults:
+        return defaults[field_name]
+    # Not a dataclass field: probe the class directly
+    try:
+        # Use object.__getattribute__ to avoid triggering lazy __getattribute__ recursion
+        return object.__getattribute__(dataclass_type, field_name)
+    except AttributeError:
+        return None
+
+
+def _placeholder_instance(lazy_type: type) -> Any:
+    """
+    Get a default-constructed instance of lazy_type for placeholder resolution.
+
+    Lazy instances resolve None fields on each attribute access, so one instance
+    per type can serve every placeholder query; instances are still dropped when
+    the active config context changes, so nothing outlives the context it was
+    built in.
+    """
+    global _placeholder_instances
+    context = current_temp_global.get(_NO_CONTEXT)
+    cached_context, instances = _placeholder_instances
+    if cached_context is not context:
+        instances = {}
+        _placeholder_instances = (context, instances)
+
+    instance = instances.get(lazy_type)
+    if instance is None:
+        instance = instances[lazy_type] = lazy_type()
+    return instance
+
+
+@lru_cache(maxsize=None)
+def _lazy_type_index() -> Dict[type, type]:
+    """
+    Get lazy_factory's base type -> lazy type index, imported on first use.
+
+    lazy_factory imports this module at load time, so the import cannot be at
+    module scope; the index is updated in place, so caching the dict is safe.
+    """
+    from hieraconf.lazy_factory import _base_to_lazy_type
+    return _base_to_lazy_type
+
+
+@lru_cache(maxsize=None)
+def _is_dataclass_class(cls: type) -> bool:
+    """Check whether cls is a dataclass, once per class."""
+    return hasattr(cls, '__dataclass_fields__')
+
+
+def _is_dataclass_value(value: Any) -> bool:
+    """dataclasses.is_dataclass(value), with the per-class check cached."""
+    return _is_dataclass_class(value if isinstance(value, type) else type(value))
+
+
+def _check_lazy_resolution(dataclass_type: type) -> bool:
+    """Check for the factory-bound lazy resolution methods, unwrapping Optional first."""
+    # Unwrap Optional types (Union[Type, None])
+    if get_origin(dataclass_type) is Union:
+        args = get_args(dataclass_type)
+        if len(args) == 2 and type(None) in args:
+            dataclass_type = next(arg for arg in args if arg is not type(None))
+
+    return (hasattr(dataclass_type, '_resolve_field_value') and
+            hasattr(dataclass_type, 'to_base_config'))
+
+
+# Lazy classes get their resolution methods bound before they are registered or
+# handed out, so the answer for a given type never changes
+_cached_lazy_resolution = lru_cache(maxsize=None)(_check_lazy_resolution)
+
 
 # _has_concrete_field_override moved to dual_axis_resolver_recursive.py
 # Placeholder service should not contain inheritance logic
@@ -30,16 +184,11 @@ class LazyDefaultPlaceholderService:
     @staticmethod
     def has_lazy_resolution(dataclass_type: type) -> bool:
         """Check if dataclass has lazy resolution methods (created by factory)."""
-        from typing import get_origin, get_args, Union
-        
-        # Unwrap Optional types (Union[Type, None])
-        if get_origin(dataclass_type) is Union:
-            args = get_args(dataclass_type)
-            if len(args) == 2 and type(None) in args:
-                dataclass_type = next(arg for arg in args if arg is not type(None))
-        
-        return (hasattr(dataclass_type, '_resolve_field_value') and
-                hasattr(dataclass_type, 'to_base_config'))
+        try:
+            return _cached_lazy_resolution(dataclass_type)
+        except TypeError:
+            # Unhashable annotation (e.g. Annotated with unhashable metadata)
+            return _check_lazy_resolution(dataclass_type)
 
     @staticmethod
     def get_lazy_resolved_placeholder(
@@ -61,7 +210,16 @@ class LazyDefaultPlaceholderService:
             Formatted placeholder text or None if no resolution possible
         """
         prefix = placeholder_prefix or LazyDefaultPlaceholderService.PLACEHOLDER_PREFIX
-        
+        # Field names often come from UI widgets; interned names match the interned
+        # keys of class dicts and the lazy field map by identity
+        field_name = _intern_name(field_name)
+
+        # Class-default placeholders do not depend on context; serve repeats from the cache
+        cache_key = (dataclass_type, field_name, prefix) if isinstance(dataclass_type, type) else None
+        cached_placeholder = _class_default_placeholders.get(cache_key, _MISSING)
+        if cached_placeholder is not _MISSING:
+            return cached_placeholder
+
         # Check if this is a lazy dataclass
         is_lazy = LazyDefaultPlaceholderService.has_lazy_resolution(dataclass_type)
         
@@ -72,14 +230,17 @@ class LazyDefaultPlaceholderService:
                 dataclass_type = lazy_type
             else:
                 # Use direct class default for non-lazy types
-                return LazyDefaultPlaceholderService._get_class_default_placeholder(
+                placeholder = LazyDefaultPlaceholderService._get_class_default_placeholder(
                     dataclass_type, field_name, prefix
                 )
+                if cache_key is not None:
+                    _class_default_placeholders[cache_key] = placeholder
+                return placeholder
         
         # Simple approach: Create new instance and let lazy system handle context resolution
         # The context_obj parameter is unused since context should be set externally via config_context()
         try:
-            instance = dataclass_type()
+            instance = _placeholder_instance(dataclass_type)
             resolved_value = getattr(instance, field_name)
             return LazyDefaultPlaceholderService._format_placeholder_text(resolved_value, prefix)
         except Exception as e:
@@ -91,64 +252,41 @@ class LazyDefaultPlaceholderService:
     @staticmethod
     def _get_lazy_type_for_base(base_type: type) -> Optional[type]:
         """Get the lazy type for a base dataclass type (reverse lookup)."""
-        from hieraconf.lazy_factory import _lazy_type_registry
-        
-        for lazy_type, registered_base_type in _lazy_type_registry.items():
-            if registered_base_type == base_type:
-                return lazy_type
-        return None
+        return _lazy_type_index().get(base_type)
 
 
 
     @staticmethod
     def _get_class_default_placeholder(dataclass_type: type, field_name: str, prefix: str) -> Optional[str]:
         """Get placeholder for non-lazy dataclasses using class defaults."""
-        try:
-            # Use object.__getattribute__ to avoid triggering lazy __getattribute__ recursion
-            class_default = object.__getattribute__(dataclass_type, field_name)
-            if class_default is not None:
-                return LazyDefaultPlaceholderService._format_placeholder_text(class_default, prefix)
-        except AttributeError:
-            pass
+        class_default = _class_default(dataclass_type, _intern_name(field_name))
+        if class_default is not None:
+            return LazyDefaultPlaceholderService._format_placeholder_text(class_default, prefix)
         return None
 
     @staticmethod
     def _get_class_default_value(dataclass_type: type, field_name: str) -> Any:
         """Get class default value for a field."""
-        try:
-            # Use object.__getattribute__ to avoid triggering lazy __getattribute__ recursion
-            return object.__getattribute__(dataclass_type, field_name)
-        except AttributeError:
-            return None
+        return _class_default(dataclass_type, _intern_name(field_name))
 
     @staticmethod
     def _format_placeholder_text(resolved_value: Any, prefix: str) -> Optional[str]:
         """Format resolved value into placeholder text."""
         if resolved_value is None:
             value_text = LazyDefaultPlaceholderService.NONE_VALUE_TEXT
-        elif hasattr(resolved_value, '__dataclass_fields__'):
+        elif _is_dataclass_value(resolved_value):
             value_text = LazyDefaultPlaceholderService._format_nested_dataclass_summary(resolved_value)
         else:
             # Apply proper formatting for different value types
-            if hasattr(resolved_value, 'value') and hasattr(resolved_value, 'name'):  # Enum
-                try:
-                    # Optional UI integration - install openhcs for full functionality
-                    from openhcs.ui.shared.ui_utils import format_enum_display
-                    value_text = format_enum_display(resolved_value)
-                except ImportError:
-                    value_text = str(resolved_value)
+            if isinstance(resolved_value, Enum):
+                value_text = _enum_formatter()(resolved_value)
             else:
                 value_text = str(resolved_value)
         
         # Apply prefix formatting
-        if not prefix:
-            return value_text
-        elif prefix.endswith(': '):
-            return f"{prefix}{value_text}"
-        elif prefix.endswith(':'):
-            return f"{prefix} {value_text}"
-        else:
-            return f"{prefix}: {value_text}"
+        if prefix == _DEFAULT_PREFIX:
+            return _format_with_default_prefix(value_text)
+        return _prefix_formatter(prefix)(value_text)
 
     @staticmethod
     def _format_nested_dataclass_summary(dataclass_instance) -> str:
@@ -157,7 +295,7 @@ class LazyDefaultPlaceholderService:
         """
         
         class_name = dataclass_instance.__class__.__name__
-        all_fields = [f.name for f in dataclasses.fields(dataclass_instance)]
+        all_fields = _cached_field_names(dataclass_instance.__class__)
         
         field_summaries = []
         for field_name in all_fields:
@@ -169,16 +307,11 @@ class LazyDefaultPlaceholderService:
                     continue
                 
                 # Format different value types appropriately
-                if hasattr(value, 'value') and hasattr(value, 'name'):  # Enum
-                    try:
-                        # Optional UI integration - install openhcs for full functionality
-                        from openhcs.ui.shared.ui_utils import format_enum_display
-                        formatted_value = format_enum_display(value)
-                    except ImportError:
-                        formatted_value = str(value)
+                if isinstance(value, Enum):
+                    formatted_value = _enum_formatter()(value)
                 elif isinstance(value, str) and len(value) > 20:  # Long strings
                     formatted_value = f"{value[:17]}..."
-                elif dataclasses.is_dataclass(value):  # Nested dataclass
+                elif _is_dataclass_value(value):  # Nested dataclass
                     formatted_value = f"{value.__class__.__name__}(...)"
                 else:
                     formatted_value = str(value)
@@ -198,3 +331,8 @@ class LazyDefaultPlaceholderService:
 def get_lazy_resolved_placeholder(*args, **kwargs):
     """Backward compatibility wrapper."""
     return LazyDefaultPlaceholderService.get_lazy_resolved_placeholder(*args, **kwargs)
+
+
+# Formatter for the default prefix, used by most placeholders
+_DEFAULT_PREFIX = LazyDefaultPlaceholderService.PLACEHOLDER_PREFIX
+_format_with_default_prefix = _prefix_formatter(_DEFAULT_PREFIX)
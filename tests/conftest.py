@@ -1,4 +1,7 @@
 """Pytest configuration and shared fixtures."""
+import sys
+import types
+
 import pytest
 from dataclasses import dataclass
 from hieraconf import set_base_config_type
@@ -47,6 +50,44 @@ def reset_base_config():
     config_module._base_config_type = original
 
 
+@pytest.fixture(autouse=True)
+def reset_pending_injections():
+    """Restore pending field injections and the classes injection exports."""
+    import hieraconf.lazy_factory as lazy_factory_module
+
+    # Snapshot the registry per target, copying the parallel per-config lists
+    original_injections = {
+        target: {
+            'target_class': data['target_class'],
+            'configs_to_inject': {name: list(values) for name, values in data['configs_to_inject'].items()},
+        }
+        for target, data in lazy_factory_module._pending_injections.items()
+    }
+    original_dirty = lazy_factory_module._pending_dirty
+    original_globals = dict(vars(lazy_factory_module))
+
+    yield
+
+    # Injection writes the rebuilt and lazy classes into the factory's own globals
+    module_globals = vars(lazy_factory_module)
+    for name in module_globals.keys() - original_globals.keys():
+        del module_globals[name]
+    module_globals.update(original_globals)
+
+    lazy_factory_module._pending_injections.clear()
+    lazy_factory_module._pending_injections.update(original_injections)
+    lazy_factory_module._pending_dirty = original_dirty
+
+
+@pytest.fixture
+def config_module():
+    """Provide a throwaway module for decorators and classes exported by injection."""
+    module = types.ModuleType("hieraconf_test_config_module")
+    sys.modules[module.__name__] = module
+    yield module
+    del sys.modules[module.__name__]
+
+
 @pytest.fixture
 def global_config():
     """Provide a test global configuration."""
@@ -6,6 +6,7 @@ from hieraconf import (
     prewarm_config_analysis_cache,
     prewarm_callable_analysis_cache,
 )
+from hieraconf.cache_warming import _nested_first_levels
 
 
 def test_prewarm_config_analysis_cache():
@@ -50,3 +51,22 @@ def test_prewarm_with_none():
 
     # Should not raise error even with None default
     prewarm_config_analysis_cache([MyConfig])
+
+
+def test_nested_first_levels():
+    """Test that nested configs are grouped into levels before their parents."""
+    @dataclass
+    class LeafConfig:
+        value: str = "leaf"
+
+    @dataclass
+    class MiddleConfig:
+        leaf: LeafConfig = None
+
+    @dataclass
+    class RootConfig:
+        middle: MiddleConfig = None
+        leaf: LeafConfig = None
+
+    levels = _nested_first_levels({RootConfig, MiddleConfig, LeafConfig})
+    assert levels == [[LeafConfig], [MiddleConfig], [RootConfig]]
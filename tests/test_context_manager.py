@@ -1,6 +1,6 @@
 """Tests for context manager module."""
 import pytest
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from hieraconf import (
     config_context,
@@ -9,7 +9,9 @@ from hieraconf import (
     clear_current_temp_global,
     merge_configs,
     extract_all_configs,
+    set_base_config_type,
 )
+from hieraconf.context_manager import _replace
 
 
 def test_config_context_basic(global_config):
@@ -77,3 +79,44 @@ def test_extract_all_configs(global_config):
         assert isinstance(configs, dict)
         # Should contain the global config by type name
         assert len(configs) > 0
+
+
+def test_config_context_reuses_base_for_identical_overrides(global_config):
+    """Test that re-entering the same config reuses the current merged config."""
+    set_base_config_type(type(global_config))
+    with config_context(global_config):
+        outer = get_current_temp_global()
+        with config_context(global_config):
+            assert get_current_temp_global() is outer
+
+
+def test_config_context_merges_attributes_set_outside_fields():
+    """Test that attributes set in __post_init__ are merged like fields."""
+    @dataclass
+    class GlobalWithName:
+        name: str = "g"
+
+    @dataclass
+    class Step:
+        def __post_init__(self):
+            self.name = "dynamic"
+
+    set_base_config_type(GlobalWithName)
+    with config_context(GlobalWithName(name="g")):
+        with config_context(Step()):
+            assert get_current_temp_global().name == "dynamic"
+
+
+def test_replace_runs_custom_init():
+    """Test that merge replacement still runs a hand-written dataclass __init__."""
+    @dataclass(frozen=True)
+    class PathConfig:
+        path: str = "a"
+
+        def __init__(self, path: str = "a"):
+            object.__setattr__(self, "path", path.upper())
+
+    config = PathConfig()
+
+    assert _replace(config, {"path": "b"}) == replace(config, path="b")
+    assert _replace(config, {"path": "b"}).path == "B"
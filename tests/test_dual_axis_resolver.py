@@ -9,6 +9,7 @@ from hieraconf import (
     extract_all_configs,
     get_current_temp_global,
 )
+from hieraconf.dual_axis_resolver import _has_concrete_field_override
 
 
 def test_resolve_field_inheritance_basic():
@@ -134,3 +135,18 @@ def test_context_hierarchy_resolution():
             shared_resolved = resolve_field_inheritance(lazy, "shared_field", available_configs)
             # At minimum, should not raise an error
             assert shared_resolved is not None or shared_resolved is None  # Both are valid
+
+
+def test_has_concrete_field_override_inherited_field():
+    """Test that a field only inherited from a parent still counts as overridden."""
+    @dataclass
+    class ParentConfig:
+        value: str = "parent"
+        unset: str = None
+
+    @dataclass
+    class InheritingConfig(ParentConfig):
+        other: int = 1
+
+    assert _has_concrete_field_override(InheritingConfig, "value")
+    assert not _has_concrete_field_override(InheritingConfig, "unset")
@@ -4,9 +4,16 @@ from dataclasses import dataclass, fields
 
 from hieraconf import (
     LazyDataclassFactory,
+    auto_create_decorator,
     register_lazy_type_mapping,
     get_base_type_for_lazy,
     config_context,
+    set_current_temp_global,
+    clear_current_temp_global,
+)
+from hieraconf.lazy_factory import (
+    _inject_all_pending_fields,
+    rebuild_hieraconf_with_new_global_reference,
 )
 
 
@@ -155,3 +162,99 @@ def test_lazy_to_base_config():
         assert isinstance(base, MyConfig)
         assert base.value == "test"
         assert base.number == 100
+
+
+def test_make_lazy_simple_reuses_cached_class():
+    """Test that repeated lazy class requests return the cached class."""
+    @dataclass
+    class CachedConfig:
+        value: str = "default"
+
+    LazyCached = LazyDataclassFactory.make_lazy_simple(CachedConfig)
+
+    assert LazyDataclassFactory.make_lazy_simple(CachedConfig) is LazyCached
+
+
+def test_inherit_as_none_positional_construction(config_module):
+    """Test that inherit_as_none configs accept positional arguments."""
+    @auto_create_decorator
+    @dataclass(frozen=True)
+    class GlobalPositionalConfig:
+        __module__ = config_module.__name__
+        num_workers: int = 4
+
+    @dataclass(frozen=True)
+    class ParentConfig:
+        value: int = 1
+        label: str = "parent"
+
+    @config_module.global_positional_config
+    @dataclass(frozen=True)
+    class ChildConfig(ParentConfig):
+        __module__ = config_module.__name__
+        extra: int = 3
+
+    assert ChildConfig() == ChildConfig(None, None, 3)
+    assert ChildConfig(5, "x", 7) == ChildConfig(value=5, label="x", extra=7)
+
+
+def test_rebuild_returns_unchanged_config():
+    """Test that rebuilding a config with nothing to convert returns it as is."""
+    @dataclass
+    class InnerConfig:
+        value: int = 1
+
+    @dataclass
+    class OuterConfig:
+        inner: InnerConfig = None
+        number: int = 0
+
+    @dataclass
+    class RebuildGlobalConfig:
+        num_workers: int = 4
+
+    outer = OuterConfig(inner=InnerConfig(5), number=2)
+
+    assert rebuild_hieraconf_with_new_global_reference(outer, RebuildGlobalConfig()) is outer
+
+
+def test_inject_pending_fields_skips_when_unchanged(config_module):
+    """Test that injection leaves targets alone when nothing new was decorated."""
+    @auto_create_decorator
+    @dataclass(frozen=True)
+    class GlobalInjectionConfig:
+        __module__ = config_module.__name__
+        num_workers: int = 4
+
+    @config_module.global_injection_config
+    @dataclass(frozen=True)
+    class InjectedConfig:
+        __module__ = config_module.__name__
+        value: int = 1
+
+    _inject_all_pending_fields()
+    injected_global = config_module.GlobalInjectionConfig
+    assert "injected_config" in injected_global.__dataclass_fields__
+
+    _inject_all_pending_fields()
+    assert config_module.GlobalInjectionConfig is injected_global
+
+
+def test_lazy_resolution_from_context_instance_attribute():
+    """Test that a context attribute set outside its dataclass fields is used."""
+    @dataclass
+    class WellConfig:
+        value: str = "default"
+
+    LazyWellConfig = LazyDataclassFactory.make_lazy_simple(WellConfig)
+
+    @dataclass
+    class Context:
+        def __post_init__(self):
+            self.well_config = WellConfig(value="from_instance")
+
+    set_current_temp_global(Context())
+    try:
+        assert LazyWellConfig().value == "from_instance"
+    finally:
+        clear_current_temp_global()
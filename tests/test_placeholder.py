@@ -59,3 +59,21 @@ def test_has_lazy_resolution():
     if hasattr(service, 'has_lazy_resolution'):
         # Lazy config should have lazy resolution
         assert service.has_lazy_resolution(LazyConfig)
+
+
+def test_placeholder_accepts_str_subclass_field_name():
+    """Test that field names given as str subclasses resolve like plain names."""
+    class FieldName(str):
+        pass
+
+    @dataclass
+    class PlainConfig:
+        value: str = "default"
+
+    placeholder = LazyDefaultPlaceholderService.get_lazy_resolved_placeholder(
+        PlainConfig, FieldName("value")
+    )
+    assert placeholder == LazyDefaultPlaceholderService.get_lazy_resolved_placeholder(
+        PlainConfig, "value"
+    )
+    assert "default" in placeholder